@@ -8,63 +8,171 @@
 - 增强了梁设计结果提取，使用 GetSummaryResultsBeam_2 获取更详细数据
 - 修正了原版备用提取函数的错误
 - 完整的设计流程：准备 → 设计 → 提取 → 验证
+
+性能说明：设置与提取的耗时主要来自 pythonnet 跨 CLR/COM 的逐次调用 (interop-bound)，而非 Python 计算。
+  - 设置 (set_*_rebar_fixed / set_frames_to_concrete_design / verify_design_setup)：interop-bound，
+    优先批量接口 (GetAllFrames) 与按名称缓存的类型查询
+  - 结果提取 (results_extraction.design_results 的 extract_*)：interop-bound，
+    复用调用方传入的构件名列表与共享占位数组；仅面积最大值归约用 NumPy
+  - CSV / 报告写出：io-bound，内存格式化后一次写入
+  - DLL / System 加载：一次性开销，进程内缓存并延迟到真正执行设计时
+修改这些热点时请附 cProfile 结果说明收益。
 """
 import os
 import sys
-import traceback
+import threading
 
-# --- System程序集加载 ---
-import clr
+from common.etabs_setup import get_etabs_objects
+from common.utility_functions import _empty_arrays, check_ret
+from common.config import (DEBUG_TRACEBACK, DESIGN_DEBUG_LOGS, DESIGN_MATCH_BY_SECTION, PERFORM_CONCRETE_DESIGN,
+                           SCRIPT_DIRECTORY)
 
-try:
-    clr.AddReference("System")
-    import System
 
-    print("✅ System程序集加载成功")
-except Exception as e:
-    print(f"❌ System程序集加载失败: {e}")
-    sys.exit(1)
+def _dlog(msg):
+    """设计准备步骤的逐项进度信息，仅在 DESIGN_DEBUG_LOGS 开启时输出"""
+    if DESIGN_DEBUG_LOGS:
+        print(msg)
 
-from common.etabs_setup import get_etabs_objects
-from common.utility_functions import check_ret
-from common.config import PERFORM_CONCRETE_DESIGN, SCRIPT_DIRECTORY
 
-# 类型别名
-INT = System.Int32
+# --- System程序集延迟加载 ---
+# pythonnet 初始化 CLR 可能耗时数秒；仅在真正执行设计时加载，跳过设计的流程导入本模块几乎无开销
+_clr = None
+System = None
+_INT_BOXES = None
 
 
-def ensure_etabs_v22_loaded():
-    """确保ETABS v22 API正确加载"""
+def _load_system():
+    """首次调用时导入 clr 并加载 System 程序集，返回 System 命名空间"""
+    global _clr, System
+    if System is None:
+        try:
+            import clr
+            clr.AddReference("System")
+            import System as _System
+
+            _clr, System = clr, _System
+            print("✅ System程序集加载成功")
+        except Exception as e:
+            print(f"❌ System程序集加载失败: {e}")
+            sys.exit(1)
+    return System
+
+
+def INT(value=0):
+    """System.Int32 构造 (类型别名，延迟加载 System)"""
+    return _load_system().Int32(value)
+
+
+def _int_boxes():
+    """共享的两个 Int32 ref 参数占位；非线程安全，仅供单线程的类型查询函数使用"""
+    global _INT_BOXES
+    if _INT_BOXES is None:
+        _INT_BOXES = (INT(0), INT(0))
+    return _INT_BOXES
+
+
+# ETABS v22 DLL 候选路径及已加载的 ETABSv1 模块缓存
+_ETABS_DLL_CANDIDATES = (
+    r"C:\Program Files\Computers and Structures\ETABS 22\ETABSv1.dll",
+    r"C:\Program Files (x86)\Computers and Structures\ETABS 22\ETABSv1.dll",
+)
+_ETABSv1 = None
+_ETABSv1_lock = threading.Lock()
+
+# 记录上次成功加载的 DLL 路径，后续进程只需验证这一个路径
+_ETABS_DLL_PATH_CACHE = os.path.join(SCRIPT_DIRECTORY, "etabs_api_path.cache")
+
+def _read_cached_dll_path():
+    """读取上次成功加载的 DLL 路径，无缓存返回 None"""
     try:
-        etabs_paths = [
-            r"C:\Program Files\Computers and Structures\ETABS 22\ETABSv1.dll",
-            r"C:\Program Files (x86)\Computers and Structures\ETABS 22\ETABSv1.dll"
-        ]
-
-        for path in etabs_paths:
-            if os.path.exists(path):
-                clr.AddReference(path)
+        with open(_ETABS_DLL_PATH_CACHE, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _probe_etabs_dll_path():
+    """按顺序 (64 位路径优先) 对候选路径各做一次 stat，返回第一个存在的路径并写入缓存；均不存在返回 None"""
+    for path in _ETABS_DLL_CANDIDATES:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        try:
+            with open(_ETABS_DLL_PATH_CACHE, "w", encoding="utf-8") as f:
+                f.write(path)
+        except OSError:
+            pass  # 缓存写入失败不影响加载
+        return path
+    return None
+
+
+def ensure_etabs_v22_loaded():
+    """确保ETABS v22 API正确加载（进程内只加载一次，之后直接返回缓存的模块）"""
+    global _ETABSv1
+    if _ETABSv1 is not None:
+        return _ETABSv1
+
+    with _ETABSv1_lock:
+        if _ETABSv1 is not None:
+            return _ETABSv1
+        try:
+            _load_system()
+            # 缓存路径直接交给 AddReference，不再预先探测；加载失败时才重新探测候选路径
+            path = _read_cached_dll_path()
+            if path is not None:
+                try:
+                    _clr.AddReference(path)
+                except Exception:
+                    path = None
+            if path is None:
+                path = _probe_etabs_dll_path()
+                if path is not None:
+                    _clr.AddReference(path)
+            if path is not None:
                 print(f"✅ ETABS DLL加载: {path}")
-                break
-        else:
-            clr.AddReference("ETABSv1")
-            print("✅ ETABS DLL从GAC加载")
+            else:
+                _clr.AddReference("ETABSv1")
+                print("✅ ETABS DLL从GAC加载")
+
+            import ETABSv1
+            _ETABSv1 = ETABSv1
+            return _ETABSv1
+        except Exception as e:
+            print(f"❌ 加载ETABS DLL失败: {e}")
+            return None
+
+
+# 截面/材料类型在一次运行内不变，按名称缓存成功的查询结果；模型解锁修改前调用 clear_section_caches()
+_material_type_cache = {}
+_section_type_cache = {}
+_rebar_type_cache = {}
 
-        import ETABSv1
-        return ETABSv1
-    except Exception as e:
-        print(f"❌ 加载ETABS DLL失败: {e}")
-        return None
+
+def clear_section_caches():
+    """清空材料类型、截面类型与配筋类型缓存"""
+    _material_type_cache.clear()
+    _section_type_cache.clear()
+    _rebar_type_cache.clear()
+
+
+def _ref_value(result, ref):
+    """统一 ref 参数的返回形式：pythonnet 返回 (返回码, 值, ...) 元组，旧绑定直接修改 ref 对象"""
+    if isinstance(result, tuple):
+        return result[0], result[1]
+    return result, ref.Value
 
 
 def get_material_type_fixed(prop_mat, name):
     """修复版材料类型获取 - 处理特殊材料名称"""
+    if name in _material_type_cache:
+        return _material_type_cache[name]
     try:
-        mat_type = INT(0)
-        mat_subtype = INT(0)
-        ret = prop_mat.GetType(name, mat_type, mat_subtype)
+        mat_type, mat_subtype = _int_boxes()
+        ret, value = _ref_value(prop_mat.GetType(name, mat_type, mat_subtype), mat_type)
         if ret == 0:
-            return mat_type.Value  # 6=Rebar, 2=Concrete
+            _material_type_cache[name] = int(value)
+            return _material_type_cache[name]  # 6=Rebar, 2=Concrete
         # 忽略特殊材料名称（如带"/"的材料）的错误
         return -1
     except Exception:
@@ -74,11 +182,14 @@ def get_material_type_fixed(prop_mat, name):
 
 def get_section_type_fixed(prop_frame, sec_name):
     """修复版截面类型获取 - 静默处理异常"""
+    if sec_name in _section_type_cache:
+        return _section_type_cache[sec_name]
     try:
-        section_type = INT(0)
-        ret = prop_frame.GetType(sec_name, section_type)
+        section_type = _int_boxes()[0]
+        ret, value = _ref_value(prop_frame.GetType(sec_name, section_type), section_type)
         if ret == 0:
-            return section_type.Value  # 8=Rectangular, 9=Circle
+            _section_type_cache[sec_name] = int(value)
+            return _section_type_cache[sec_name]  # 8=Rectangular, 9=Circle
         return 8  # 默认矩形
     except Exception:
         # 静默处理异常，返回默认值
@@ -87,11 +198,14 @@ def get_section_type_fixed(prop_frame, sec_name):
 
 def get_rebar_type_fixed(prop_frame, sec_name):
     """修复版配筋类型获取 - 静默处理异常"""
+    if sec_name in _rebar_type_cache:
+        return _rebar_type_cache[sec_name]
     try:
-        rebar_type = INT(0)
-        ret = prop_frame.GetTypeRebar(sec_name, rebar_type)
+        rebar_type = _int_boxes()[0]
+        ret, value = _ref_value(prop_frame.GetTypeRebar(sec_name, rebar_type), rebar_type)
         if ret == 0:
-            return rebar_type.Value  # 3=梁, 2=柱
+            _rebar_type_cache[sec_name] = int(value)
+            return _rebar_type_cache[sec_name]  # 3=梁, 2=柱
         return -1
     except Exception:
         # 静默处理异常
@@ -106,15 +220,16 @@ def create_rebar_material_fixed(sap_model, ETABSv1, mat_name="HRB400"):
         # 检查材料是否已存在
         mat_type = get_material_type_fixed(prop_material, mat_name)
         if mat_type == 6:  # 6 = Rebar
-            print(f"        ✅ 钢筋材料已存在: {mat_name}")
+            _dlog(f"        ✅ 钢筋材料已存在: {mat_name}")
             return True
 
-        print(f"        创建钢筋材料: {mat_name}")
+        _dlog(f"        创建钢筋材料: {mat_name}")
 
         # 使用枚举类型创建材料
         ret = prop_material.SetMaterial(mat_name, ETABSv1.eMatType.Rebar)
+        _material_type_cache.pop(mat_name, None)
         if ret == 0:
-            print(f"        ✅ 钢筋材料创建成功: {mat_name}")
+            _dlog(f"        ✅ 钢筋材料创建成功: {mat_name}")
 
             # 设置基本属性
             try:
@@ -122,7 +237,7 @@ def create_rebar_material_fixed(sap_model, ETABSv1, mat_name="HRB400"):
                 prop_material.SetMPIsotropic(mat_name, 2e11, 0.3, 1.17e-5)
                 # 钢筋属性 - 使用v22的正确6参数版本
                 prop_material.SetORebar_1(mat_name, 4e8, 4e8, 4.5e8, 0.002, 0.015)
-                print(f"        ✅ 钢筋材料属性设置完成")
+                _dlog("        ✅ 钢筋材料属性设置完成")
             except Exception:
                 # 静默处理属性设置失败，材料创建成功即可
                 pass
@@ -143,7 +258,7 @@ def set_beam_rebar_fixed(sap_model, prop_frame, sec_name, rebar_mat, ETABSv1):
         # 确保单位正确
         sap_model.SetPresentUnits(ETABSv1.eUnits.kN_m_C)
 
-        print(f"        设置梁配筋: {sec_name}")
+        _dlog(f"        设置梁配筋: {sec_name}")
 
         ret = prop_frame.SetRebarBeam(
             sec_name,  # Name
@@ -157,8 +272,9 @@ def set_beam_rebar_fixed(sap_model, prop_frame, sec_name, rebar_mat, ETABSv1):
             0.0006  # BotRightArea
         )
 
+        _rebar_type_cache.pop(sec_name, None)
         if ret == 0:
-            print(f"        ✅ 梁 {sec_name} 配筋设置成功")
+            _dlog(f"        ✅ 梁 {sec_name} 配筋设置成功")
             return True
         else:
             print(f"        ❌ 梁 {sec_name} 配筋失败，返回码: {ret}")
@@ -169,50 +285,65 @@ def set_beam_rebar_fixed(sap_model, prop_frame, sec_name, rebar_mat, ETABSv1):
         return False
 
 
+def _set_column_rebar_rect(prop_frame, sec_name, rebar_mat):
+    """矩形柱配筋：箍筋约束，4+4 纵筋布置，保护层 40mm，箍筋间距 150mm"""
+    return prop_frame.SetRebarColumn(
+        sec_name,  # 1. Name
+        rebar_mat,  # 2. MatPropLong
+        rebar_mat,  # 3. MatPropConfine
+        1,  # 4. Pattern (1=Rectangular)
+        1,  # 5. ConfineType (1=Ties)
+        0.040,  # 6. Cover (40mm)
+        0,  # 7. NumberCBars
+        4,  # 8. NumberR3Bars
+        4,  # 9. NumberR2Bars
+        "20",  # 10. RebarSize
+        "10",  # 11. TieSize
+        0.150,  # 12. TieSpacingLongit (150mm)
+        2,  # 13. Number2DirTieBars
+        2,  # 14. Number3DirTieBars
+        True  # 15. ToBeDesigned
+    )
+
+
+def _set_column_rebar_circle(prop_frame, sec_name, rebar_mat):
+    """圆形柱配筋：螺旋箍筋，10 根均布纵筋，保护层 40mm，箍筋间距 150mm"""
+    return prop_frame.SetRebarColumn(
+        sec_name,  # 1. Name
+        rebar_mat,  # 2. MatPropLong
+        rebar_mat,  # 3. MatPropConfine
+        2,  # 4. Pattern (2=Circle)
+        2,  # 5. ConfineType (2=Spiral)
+        0.040,  # 6. Cover (40mm)
+        10,  # 7. NumberCBars
+        0,  # 8. NumberR3Bars
+        0,  # 9. NumberR2Bars
+        "20",  # 10. RebarSize
+        "10",  # 11. TieSize
+        0.150,  # 12. TieSpacingLongit (150mm)
+        2,  # 13. Number2DirTieBars
+        2,  # 14. Number3DirTieBars
+        True  # 15. ToBeDesigned
+    )
+
+
 def set_column_rebar_fixed(sap_model, prop_frame, sec_name, rebar_mat, ETABSv1):
-    """修复版柱配筋设置"""
+    """修复版柱配筋设置 - 按截面类型分派到矩形/圆形专用函数"""
     try:
         # 确保单位正确
         sap_model.SetPresentUnits(ETABSv1.eUnits.kN_m_C)
 
-        # 判断截面类型
-        section_type = get_section_type_fixed(prop_frame, sec_name)
-        is_circle = (section_type == 9)
+        # 判断截面类型 (9=Circle，其余按矩形处理)
+        is_circle = get_section_type_fixed(prop_frame, sec_name) == 9
 
-        # 设置参数
-        pattern = 2 if is_circle else 1  # 2=Circle, 1=Rectangular
-        conf_type = 2 if is_circle else 1  # 2=Spiral, 1=Ties
-        cover = 0.040  # 40mm
-        tie_space = 0.150  # 150mm
+        _dlog(f"        设置柱配筋: {sec_name} ({'圆形' if is_circle else '矩形'})")
 
-        # 钢筋数量参数
-        if is_circle:
-            N_C, N_R3, N_R2 = 10, 0, 0  # 圆形：10根均布
-        else:
-            N_C, N_R3, N_R2 = 0, 4, 4  # 矩形：4+4布置
-
-        print(f"        设置柱配筋: {sec_name} ({'圆形' if is_circle else '矩形'})")
-
-        ret = prop_frame.SetRebarColumn(
-            sec_name,  # 1. Name
-            rebar_mat,  # 2. MatPropLong
-            rebar_mat,  # 3. MatPropConfine
-            pattern,  # 4. Pattern
-            conf_type,  # 5. ConfineType
-            cover,  # 6. Cover
-            N_C,  # 7. NumberCBars
-            N_R3,  # 8. NumberR3Bars
-            N_R2,  # 9. NumberR2Bars
-            "20",  # 10. RebarSize
-            "10",  # 11. TieSize
-            tie_space,  # 12. TieSpacingLongit
-            2,  # 13. Number2DirTieBars
-            2,  # 14. Number3DirTieBars
-            True  # 15. ToBeDesigned
-        )
+        set_rebar = _set_column_rebar_circle if is_circle else _set_column_rebar_rect
+        ret = set_rebar(prop_frame, sec_name, rebar_mat)
 
+        _rebar_type_cache.pop(sec_name, None)
         if ret == 0:
-            print(f"        ✅ 柱 {sec_name} 配筋设置成功")
+            _dlog(f"        ✅ 柱 {sec_name} 配筋设置成功")
             return True
         else:
             print(f"        ❌ 柱 {sec_name} 配筋失败，返回码: {ret}")
@@ -223,40 +354,69 @@ def set_column_rebar_fixed(sap_model, prop_frame, sec_name, rebar_mat, ETABSv1):
         return False
 
 
-def set_frames_to_concrete_design(sap_model, beam_section, col_section):
-    """关键修复：设置所有构件为混凝土设计程序 - 使用遍历所有构件的保险方法"""
-    print("      设置构件为混凝土设计程序...")
+def _get_all_frame_sections(frame_obj):
+    """通过 FrameObj.GetAllFrames 批量获取 (构件名数组, 截面名数组)，失败返回 (None, None)
+
+    直接返回 System.Array，调用方原地迭代，不再整体复制为 Python 列表。
+    """
+    empty_str, empty_dbl, empty_int = _empty_arrays()
+
+    # 参数: NumberNames, MyName, PropName, StoryName, PointName1, PointName2,
+    #       Point1X/Y/Z, Point2X/Y/Z, Angle, Offset1X/2X/1Y/2Y/1Z/2Z, CardinalPoint
+    result = frame_obj.GetAllFrames(
+        0, empty_str, empty_str, empty_str, empty_str, empty_str,
+        empty_dbl, empty_dbl, empty_dbl, empty_dbl, empty_dbl, empty_dbl,
+        empty_dbl, empty_dbl, empty_dbl, empty_dbl, empty_dbl, empty_dbl, empty_dbl,
+        empty_int,
+    )
+    ret = result[0]
+    if ret != 0:
+        print(f"        ❌ 无法获取构件列表，返回码: {ret}")
+        return None, None
+    return result[2], result[3]
+
+
+def set_frames_to_concrete_design(sap_model, beam_section, col_section, frame_name_lists=None):
+    """关键修复：设置所有构件为混凝土设计程序 - 对目标构件逐个调用 SetDesignProcedure
+
+    frame_name_lists 为调用方已获取的 (全部, 梁, 柱) 名称列表；未提供时自行获取。
+    """
+    _dlog("      设置构件为混凝土设计程序...")
 
     try:
         frame_obj = sap_model.FrameObj
 
-        # 使用GetNameList获取所有构件
-        NumberNames = INT(0)
-        MyName = System.Array.CreateInstance(System.String, 0)
-        ret, NumberNames, MyName = frame_obj.GetNameList(NumberNames, MyName)
+        # 默认按 BEAM*/COL* 名称前缀分类（与建模命名约定一致，复用调用方传入的构件列表，无需逐个 GetSection）
+        if frame_name_lists is None and not DESIGN_MATCH_BY_SECTION:
+            frame_name_lists = _design_results().get_all_frame_names(sap_model)
+        if (not DESIGN_MATCH_BY_SECTION and frame_name_lists is not None
+                and (frame_name_lists[1] or frame_name_lists[2])):
+            target_names = frame_name_lists[1] + frame_name_lists[2]
+            _dlog(f"        按名称前缀识别 {len(target_names)} 个梁/柱构件...")
+        else:
+            # 按截面识别 (DESIGN_MATCH_BY_SECTION 或命名不符合约定)：GetAllFrames 一次返回构件名与截面名的平行数组
+            frame_names, section_names = _get_all_frame_sections(frame_obj)
+            if frame_names is None:
+                return False
 
-        if ret != 0:
-            print(f"        ❌ 无法获取构件列表，返回码: {ret}")
-            return False
+            _dlog(f"        检查 {frame_names.Length} 个构件...")
 
-        frame_names = list(MyName)
-        concrete_count = 0
+            target_sections = frozenset((beam_section, col_section))
+            target_names = [name for name, section in zip(frame_names, section_names) if section in target_sections]
 
-        print(f"        检查 {len(frame_names)} 个构件...")
+        if not target_names:
+            print("        ⚠️ 未找到使用目标截面的构件")
+            return False
 
-        # 遍历所有构件，检查截面名称
-        for frame_name in frame_names:
-            try:
-                # 获取构件的截面名称
-                ret_sec, section_name = frame_obj.GetSection(frame_name, "")
-                if ret_sec == 0 and section_name in [beam_section, col_section]:
-                    # 设置为混凝土设计
-                    ret_design = frame_obj.SetDesignProcedure(frame_name, 2)  # 2 = Concrete
-                    if ret_design == 0:
-                        concrete_count += 1
-            except Exception:
-                # 静默处理单个构件的异常
-                continue
+        # 逐个构件设置 (2 = Concrete)
+        concrete_count = 0
+        set_design_procedure = frame_obj.SetDesignProcedure
+        try:
+            for frame_name in target_names:
+                if set_design_procedure(frame_name, 2) == 0:
+                    concrete_count += 1
+        except Exception as e:
+            print(f"        ⚠️ 逐个构件设置中断: {e}")
 
         print(f"        ✅ 总计设置 {concrete_count} 个构件为混凝土设计")
         return concrete_count > 0
@@ -266,9 +426,9 @@ def set_frames_to_concrete_design(sap_model, beam_section, col_section):
         return False
 
 
-def verify_design_setup(sap_model, beam_section, col_section):
-    """验证设计设置 - 静默处理异常"""
-    print("      验证设计设置...")
+def verify_design_setup(sap_model, beam_section, col_section, frame_name_lists=None):
+    """验证设计设置 - 静默处理异常；frame_name_lists 同 set_frames_to_concrete_design"""
+    _dlog("      验证设计设置...")
 
     try:
         prop_frame = sap_model.PropFrame
@@ -281,27 +441,38 @@ def verify_design_setup(sap_model, beam_section, col_section):
         beam_type_name = {3: "梁", 2: "柱", 1: "其他", 0: "未设置"}.get(beam_rebar_type, "已设置")
         col_type_name = {3: "梁", 2: "柱", 1: "其他", 0: "未设置"}.get(col_rebar_type, "已设置")
 
-        print(f"        {beam_section} 配筋类型: {beam_type_name}")
-        print(f"        {col_section} 配筋类型: {col_type_name}")
+        _dlog(f"        {beam_section} 配筋类型: {beam_type_name}")
+        _dlog(f"        {col_section} 配筋类型: {col_type_name}")
 
-        # 验证构件设计程序
+        # 验证构件设计程序：复用调用方传入的梁/柱分类抽样，无分类时抽样模型中的前10个构件
         concrete_design_count = 0
-        NumberNames = INT(0)
-        FrameNames_tuple = System.Array.CreateInstance(System.String, 0)
-        ret, NumberNames, FrameNames_tuple = frame_obj.GetNameList(NumberNames, FrameNames_tuple)
-
-        if ret == 0:
-            frame_names = list(FrameNames_tuple)
-            for name in frame_names[:10]:  # 抽样检查前10个
-                try:
-                    proc_type = INT(0)
-                    ret_proc = frame_obj.GetDesignProcedure(name, proc_type)
-                    if ret_proc == 0 and proc_type.Value == 2:  # 2 = Concrete
+        frame_names = None
+        if frame_name_lists is None:
+            frame_name_lists = _design_results().get_all_frame_names(sap_model)
+        if frame_name_lists is not None and (frame_name_lists[1] or frame_name_lists[2]):
+            _, beam_names, col_names = frame_name_lists
+            frame_names = beam_names[:5] + col_names[:5]
+            frame_names += (beam_names[5:] + col_names[5:])[:10 - len(frame_names)]
+        else:
+            empty_str, _, _ = _empty_arrays()
+            ret, NumberNames, FrameNames_tuple = frame_obj.GetNameList(0, empty_str)
+            if ret == 0 and NumberNames > 0:
+                # 直接按索引取前10个，避免把整个 System.Array 转为 Python 列表
+                frame_names = [FrameNames_tuple.GetValue(i)
+                               for i in range(min(10, NumberNames, FrameNames_tuple.Length))]
+
+        if frame_names is not None:
+            get_design_procedure = frame_obj.GetDesignProcedure
+            try:
+                for name in frame_names:  # 抽样检查前10个
+                    # pythonnet 以 (返回码, MyType) 元组返回 ref 参数
+                    ret_proc, proc_type = get_design_procedure(name, 0)
+                    if ret_proc == 0 and proc_type == 2:  # 2 = Concrete
                         concrete_design_count += 1
-                except:
-                    pass
+            except Exception as e:
+                print(f"        ⚠️ 设计程序抽样中断: {e}")
 
-        print(f"        混凝土设计程序验证: {concrete_design_count}/10")
+        _dlog(f"        混凝土设计程序验证: {concrete_design_count}/10")
 
         # 即使验证显示异常，如果设置过程成功，仍返回True
         return True
@@ -311,10 +482,14 @@ def verify_design_setup(sap_model, beam_section, col_section):
         return True  # 验证失败不影响主流程
 
 
-def prepare_model_for_design():
-    """最终版模型设计准备"""
+def prepare_model_for_design(sap_model=None, frame_name_lists=None):
+    """最终版模型设计准备；sap_model 由调用方传入时不再重复获取
+
+    frame_name_lists 为调用方已获取的 (全部, 梁, 柱) 名称列表；未提供时自行获取。
+    """
     print("\n--- 准备模型进行设计 (最终精简版) ---")
-    _, sap_model = get_etabs_objects()
+    if sap_model is None:
+        _, sap_model = get_etabs_objects()
     if not sap_model:
         return False
 
@@ -331,27 +506,26 @@ def prepare_model_for_design():
         if sap_model.GetModelIsLocked():
             sap_model.SetModelIsLocked(False)
             print("  模型已解锁...")
-
-        # 验证截面分配
-        NumberNames = 0
-        FrameNames_tuple = System.Array.CreateInstance(System.String, 0)
-        ret, NumberNames, FrameNames_tuple = sap_model.FrameObj.GetNameList(NumberNames, FrameNames_tuple)
-
-        if ret == 0:
-            frame_names = list(FrameNames_tuple)
-            beam_count = len([n for n in frame_names if n.upper().startswith("BEAM")])
-            col_count = len([n for n in frame_names if n.upper().startswith("COL")])
-            print(f"  发现: {beam_count} 根梁, {col_count} 根柱")
-
-        print("  设置配筋类型...")
+        clear_section_caches()
 
         # 设置单位
         sap_model.SetPresentUnits(ETABSv1.eUnits.kN_m_C)
         print(f"    单位设置: kN_m_C")
 
-        # 创建钢筋材料
         rebar_material = "HRB400"
-        create_rebar_material_fixed(sap_model, ETABSv1, rebar_material)
+
+        # 验证截面分配
+        if frame_name_lists is None:
+            frame_name_lists = _design_results().get_all_frame_names(sap_model)
+        if frame_name_lists is not None:
+            _, beam_names, col_names = frame_name_lists
+            print(f"  发现: {len(beam_names)} 根梁, {len(col_names)} 根柱")
+
+        print("  设置配筋类型...")
+
+        # 创建钢筋材料：已存在时不算改动 (类型查询结果会缓存，创建函数内的同一检查不再调用 COM)
+        rebar_existed = get_material_type_fixed(sap_model.PropMaterial, rebar_material) == 6
+        material_created = create_rebar_material_fixed(sap_model, ETABSv1, rebar_material) and not rebar_existed
 
         # 设置截面配筋
         prop_frame = sap_model.PropFrame
@@ -360,31 +534,39 @@ def prepare_model_for_design():
 
         # 关键步骤：设置构件为混凝土设计程序
         design_proc_success = set_frames_to_concrete_design(sap_model, FRAME_BEAM_SECTION_NAME,
-                                                            FRAME_COLUMN_SECTION_NAME)
+                                                            FRAME_COLUMN_SECTION_NAME, frame_name_lists)
 
         # 验证设置
-        verify_success = verify_design_setup(sap_model, FRAME_BEAM_SECTION_NAME, FRAME_COLUMN_SECTION_NAME)
+        verify_success = verify_design_setup(sap_model, FRAME_BEAM_SECTION_NAME, FRAME_COLUMN_SECTION_NAME,
+                                             frame_name_lists)
+
+        overall_success = beam_success and col_success and design_proc_success
 
-        # 保存并重新分析
-        sap_model.File.Save()
+        # 保存并重新分析：未新建材料且没有任何设置成功时模型未改动，跳过 File.Save 的整文件写盘
+        if material_created or beam_success or col_success or design_proc_success:
+            sap_model.File.Save()
+        else:
+            print("  未修改任何设置，跳过保存")
         sap_model.SetModelIsLocked(True)
         print("  重新运行分析...")
         check_ret(sap_model.Analyze.RunAnalysis(), "RunAnalysis")
         print("  分析完成。")
 
-        overall_success = beam_success and col_success and design_proc_success
         print(f"  准备阶段: {'✅ 完全成功' if overall_success else '⚠️ 部分成功'}")
         return overall_success
 
     except Exception as e:
         print(f"❌ 准备过程异常: {e}")
-        traceback.print_exc()
+        if DEBUG_TRACEBACK:
+            import traceback  # 仅调试输出时才导入
+            traceback.print_exc()
         return False
 
 
-def run_concrete_design():
-    """运行混凝土设计"""
-    _, sap_model = get_etabs_objects()
+def run_concrete_design(sap_model=None):
+    """运行混凝土设计；sap_model 由调用方传入时不再重复获取"""
+    if sap_model is None:
+        _, sap_model = get_etabs_objects()
     print("\n🎯 运行混凝土设计...")
 
     try:
@@ -418,62 +600,91 @@ def run_concrete_design():
 # ==================== 整合的数据提取和单位转换修复功能 ====================
 # 逻辑已迁移至 results_extraction.design_results
 
-# Use results_extraction design results helpers to avoid circular import on analysis package init
-from results_extraction import design_results as _design_results
+# results_extraction 会连带导入 numpy/pandas 等依赖，改为首次使用时再导入；
+# 同时避免 analysis 包初始化时的循环导入
+def _design_results():
+    """延迟导入并返回 results_extraction.design_results 模块"""
+    from results_extraction import design_results
+    return design_results
+
+
+# 兼容旧的模块级导出名：首次访问时解析并缓存到模块命名空间 (PEP 562)
+_LAZY_RESULT_EXPORTS = {
+    "extract_design_results_enhanced": "extract_design_results_enhanced",
+    "save_design_results_enhanced": "save_design_results_enhanced",
+    "generate_enhanced_summary_report": "generate_enhanced_summary_report",
+    # 原版（按 BEAM*/COL* 前缀）提取器：作为增强版的对照/回退使用，保留原公开名称
+    "extract_and_save_beam_results": "extract_and_save_beam_results",
+    "extract_and_save_column_results": "extract_and_save_column_results",
+}
+
+
+def __getattr__(name):
+    target = _LAZY_RESULT_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_design_results(), target)
+    globals()[name] = value
+    return value
 
-extract_design_results_enhanced = _design_results.extract_design_results_enhanced
-save_design_results_enhanced = _design_results.save_design_results_enhanced
-generate_enhanced_summary_report = _design_results.generate_enhanced_summary_report
-extract_and_save_beam_results = _design_results.extract_and_save_beam_results
-extract_and_save_column_results = _design_results.extract_and_save_column_results
 
 def perform_concrete_design_and_extract_results():
     """整合增强版主执行函数"""
+    if not PERFORM_CONCRETE_DESIGN:
+        print("⏭️ 跳过构件设计。")
+        return True
+
     print("\n" + "=" * 80)
     print("🎯 执行混凝土梁柱配筋设计 (v22.24b - 梁提取功能增强版)")
     print("=" * 80)
 
-    output_dir = SCRIPT_DIRECTORY if 'SCRIPT_DIRECTORY' in globals() else os.getcwd()
+    output_dir = SCRIPT_DIRECTORY or os.getcwd()
 
     try:
-        if not PERFORM_CONCRETE_DESIGN:
-            print("⏭️ 跳过构件设计。")
-            return True
-
         print("🚀 开始整合增强流程...")
 
+        # 输出目录与文件路径在此处解析一次（公开的提取函数仍各自确保目录存在）
+        os.makedirs(output_dir, exist_ok=True)
+        results = _design_results()
+        # SapModel 只获取一次，传给各阶段
+        _, sap_model = get_etabs_objects()
+        beam_csv_path = os.path.join(output_dir, results.BEAM_RESULTS_FILENAME)
+        column_csv_path = os.path.join(output_dir, results.COLUMN_RESULTS_FILENAME)
+        # 梁/柱名称只取一次 (设计准备不增删构件)，供模型准备与原版提取共用
+        frame_name_lists = results.get_all_frame_names(sap_model)
+
         # 阶段1: 模型准备
         print("\n📋 阶段1: 模型设计准备")
-        design_prep_success = prepare_model_for_design()
+        design_prep_success = prepare_model_for_design(sap_model, frame_name_lists)
 
         # 阶段2: 运行设计
         print("\n🎯 阶段2: 执行混凝土设计")
-        design_success = run_concrete_design()
+        design_success = run_concrete_design(sap_model)
 
         # 阶段3: 增强版数据提取
         if design_success:
             print("\n📊 阶段3: 增强版结果提取")
-            design_results = extract_design_results_enhanced()
+            design_results = results.extract_design_results_enhanced()
 
             if design_results:
                 # 保存增强版结果
-                save_design_results_enhanced(design_results, output_dir)
-                generate_enhanced_summary_report(output_dir)
+                results.save_design_results_enhanced(design_results, output_dir)
+                results.generate_enhanced_summary_report(output_dir)
 
                 # 同时保存原版结果作为对比
                 print("\n📁 生成原版结果作为对比...")
-                extract_and_save_beam_results(output_dir)
-                extract_and_save_column_results(output_dir)
             else:
                 print("❌ 增强版结果提取失败，尝试原版方法...")
-                extract_and_save_beam_results(output_dir)
-                extract_and_save_column_results(output_dir)
+
+            # 复用阶段1前获取的梁/柱名称，传给两个原版提取函数
+            _, beam_names, column_names = frame_name_lists if frame_name_lists is not None else (None, None, None)
+            results.extract_and_save_beam_results(output_dir, beam_csv_path, beam_names)
+            results.extract_and_save_column_results(output_dir, column_csv_path, column_names)
         else:
             print("❌ 设计失败，跳过结果提取")
 
         # 恢复视图
         try:
-            _, sap_model = get_etabs_objects()
             sap_model.View.RefreshView(0, False)
         except:
             pass
@@ -504,7 +715,9 @@ def perform_concrete_design_and_extract_results():
 
     except Exception as e:
         print(f"❌ 主函数异常: {e}")
-        traceback.print_exc()
+        if DEBUG_TRACEBACK:
+            import traceback  # 仅调试输出时才导入
+            traceback.print_exc()
         return False
     finally:
         print("\n--- design_module (整合增强版) 结束 ---")
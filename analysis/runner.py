@@ -24,13 +24,19 @@ def _log(message: str) -> None:
     print(f"[分析] {message}")
 
 
-def safe_run_analysis(load_cases_to_run: Sequence[str], delete_old_results: bool = True) -> None:
+def safe_run_analysis(
+    load_cases_to_run: Sequence[str],
+    delete_old_results: bool = True,
+    exclusive_cases: bool = False,
+) -> None:
     """
     安全运行 ETABS 分析：解锁模型、保存、选工况、清理旧结果并执行分析。
 
     Args:
         load_cases_to_run: 需要运行的工况名称列表。
         delete_old_results: 运行前是否清理旧结果。
+        exclusive_cases: 为 True 时先关闭全部工况的运行标记，只运行所列工况；
+            默认保留未列出工况（如模型中已启用的模态/反应谱工况）的原有运行标记。
     """
     _, sap_model = get_etabs_objects()
     if sap_model is None:
@@ -63,14 +69,18 @@ def safe_run_analysis(load_cases_to_run: Sequence[str], delete_old_results: bool
     num_val = System.Int32(0)
     names_val = System.Array[System.String](0)
     ret_tuple = sap_model.LoadCases.GetNameList(num_val, names_val)
-    defined_cases = list(ret_tuple[2]) if ret_tuple[0] == 0 and ret_tuple[1] > 0 and ret_tuple[2] is not None else []
+    defined_cases = (frozenset(ret_tuple[2]) if ret_tuple[0] == 0 and ret_tuple[1] > 0 and ret_tuple[2] is not None
+                     else frozenset())
 
-    # 设置要运行的工况
+    # 设置要运行的工况；exclusive_cases 时先以 All=True 一次关闭全部工况，再只开启所需工况
+    set_run_case_flag = analyze_obj.SetRunCaseFlag
+    if exclusive_cases and set_run_case_flag("", False, True) != 0:
+        _log("⚠️ 批量关闭工况运行标记失败，未列出的工况将保持原设置。")
     for case in load_cases_to_run:
         if defined_cases and case not in defined_cases:
             _log(f"⚠️ 工况 '{case}' 未定义，跳过。")
             continue
-        if sap_model.Analyze.SetRunCaseFlag(case, True) != 0:
+        if set_run_case_flag(case, True) != 0:
             _log(f"⚠️ 设置工况 '{case}' 运行失败。")
 
     # 清理旧结果
@@ -89,12 +99,30 @@ def safe_run_analysis(load_cases_to_run: Sequence[str], delete_old_results: bool
     _log("✅ 分析成功完成。")
 
 
+def _wait_until_model_ready(sap_model, timeout_seconds: float, poll_interval: float = 0.1) -> bool:
+    """
+    以轻量 COM 调用探测模型是否可响应，最长等待 timeout_seconds 秒。
+
+    Returns:
+        模型在超时前响应返回 True，否则 False。
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            sap_model.GetModelFilename()
+            return True
+        except Exception:  # noqa: BLE001
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+
+
 def wait_and_run_analysis(wait_seconds: int = 5) -> None:
     """
-    在指定等待后运行固定工况的分析。
+    等待模型就绪后运行固定工况的分析。
 
     Args:
-        wait_seconds: 运行前的等待时间（秒）。
+        wait_seconds: 等待模型响应的最长时间（秒）；模型已就绪时立即开始。
     """
     my_etabs, sap_model = get_etabs_objects()
     if sap_model is None:
@@ -102,8 +130,9 @@ def wait_and_run_analysis(wait_seconds: int = 5) -> None:
         return
 
     load_cases = list(DEFAULT_LOAD_CASES)
-    _log(f"等待 {wait_seconds} 秒后开始分析工况: {load_cases}")
-    time.sleep(wait_seconds)
+    _log(f"等待模型就绪（最长 {wait_seconds} 秒）后开始分析工况: {load_cases}")
+    if not _wait_until_model_ready(sap_model, wait_seconds):
+        _log(f"⚠️ 模型 {wait_seconds} 秒内未响应，仍尝试运行分析。")
 
     try:
         safe_run_analysis(load_cases)
@@ -7,6 +7,7 @@ Existing code continues to rely on module-level constants; new code should prefe
 
 import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 # ========== ETABS 路径配置 ==========
@@ -79,6 +80,23 @@ PERFORM_CONCRETE_DESIGN = True
 CONCRETE_DESIGN_CODE = "GB 50010-2010(2015)"
 EXPORT_ALL_DESIGN_FILES = False
 
+# 设置混凝土设计程序时按截面名 (GetAllFrames) 而非 BEAM*/COL* 名称前缀识别构件；
+# 用于不符合建模命名约定的模型
+DESIGN_MATCH_BY_SECTION = False
+
+# 设计流程异常时是否打印完整调用栈 (默认只打印异常信息)
+DEBUG_TRACEBACK = False
+
+# 设计准备各步骤是否输出逐项进度信息 (失败/警告与汇总信息始终输出)
+DESIGN_DEBUG_LOGS = False
+
+
+# 输出目录路径对象在调用时构建，运行中修改 SCRIPT_DIRECTORY 后立即生效
+def script_directory_path() -> Path:
+    """Output directory as a Path, built from the current SCRIPT_DIRECTORY on each call."""
+    return Path(SCRIPT_DIRECTORY)
+
+
 # ---------------------------------------------------------------------------
 # Optional structured settings (non-breaking): exposes the above constants via
 # typed dataclasses. Existing call sites can continue using globals.
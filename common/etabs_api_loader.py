@@ -34,6 +34,7 @@ def load_dotnet_etabs_api():
         ETABSv1 = EtabsApiModule
         print("ETABS API 引用已成功加载。现在可以通过 ETABSv1.xxx 访问其成员。")
 
+        invalidate_api_cache()
         return ETABSv1, System, COMException
 
     except ImportError as exc:
@@ -53,7 +54,43 @@ def get_api_objects():
     return ETABSv1, System, COMException
 
 
+def _api():
+    """
+    与 get_api_objects() 相同，但 API 加载完成后只组装一次元组并缓存；
+    供每个 API 调用都要取 System 的热路径函数（check_ret / arr / AddByCoord 包装）使用。
+    """
+    global _API_CACHE
+    if _API_CACHE is None:
+        if ETABSv1 is None or System is None:
+            # 尚未加载：不缓存，下次调用重新读取
+            return ETABSv1, System, COMException
+        _API_CACHE = (ETABSv1, System, COMException)
+    return _API_CACHE
+
+
+def _com_errors():
+    """
+    COM 调用的预期异常类型：COMException、InvalidCastException、InvalidComObjectException。
+    .NET 运行时未加载时返回空元组（except 子句不匹配任何异常，交由调用方的通用分支处理）。
+    """
+    _, system, com_exception = _api()
+    if system is None or com_exception is None:
+        return ()
+    return (
+        com_exception,
+        system.InvalidCastException,
+        system.Runtime.InteropServices.InvalidComObjectException,
+    )
+
+
+def invalidate_api_cache():
+    """清除 _api() 的缓存（重新加载 API 或重新连接 ETABS 时调用）。"""
+    global _API_CACHE
+    _API_CACHE = None
+
+
 # 模块级变量
 ETABSv1 = None
 System = None
 COMException = None
+_API_CACHE = None
@@ -8,6 +8,7 @@ ETABS 设置模块
 import time
 import sys
 from .utility_functions import check_ret
+from .etabs_api_loader import _api, _com_errors
 from .config import (
     ATTACH_TO_INSTANCE, REMOTE, REMOTE_COMPUTER, SPECIFY_PATH, PROGRAM_PATH,
     NUM_STORIES, TYPICAL_STORY_HEIGHT, BOTTOM_STORY_HEIGHT,
@@ -18,26 +19,43 @@ from .config import (
 my_etabs = None
 sap_model = None
 
+# 等待 ETABS 就绪的最长时间与轮询间隔（秒）
+_READY_TIMEOUT_SECONDS = 15.0
+_READY_POLL_INTERVAL = 0.1
 
-def setup_etabs():
-    """设置ETABS连接与模型初始化"""
-    global my_etabs, sap_model
-
-    # 重新导入API对象以确保它们已正确加载
-    from .etabs_api_loader import get_api_objects
-    ETABSv1, System, COMException = get_api_objects()
+# is_etabs_connected() 的健康探测结果缓存时长（秒）与最近一次探测成功的时间戳
+_HEALTH_TTL = 0.5
+_last_ok_ts = 0.0
 
-    if ETABSv1 is None:
-        sys.exit("致命错误: ETABSv1 API 未正确加载")
 
-    print("\nETABS 连接与模型初始化...")
+def _wait_for_sap_model(etabs_object, timeout_seconds=_READY_TIMEOUT_SECONDS):
+    """
+    轮询 SapModel 直到其可响应简单 API 调用，超时返回 None。
+    替代固定等待：实例已就绪（如附加到已运行实例）时立即返回。
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        try:
+            model = etabs_object.SapModel
+            if model is not None:
+                model.GetModelFilename()
+                return model
+        except Exception:
+            pass
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(_READY_POLL_INTERVAL)
+
+
+def _start_or_attach_etabs(ETABSv1, COMException):
+    """按配置附加到已运行实例或启动新实例，返回 ETABS 对象"""
     helper = ETABSv1.cHelper(ETABSv1.Helper())
 
     if ATTACH_TO_INSTANCE:
         print("正在尝试附加到已运行的ETABS 实例...")
         try:
             getter = helper.GetObjectHost if REMOTE else helper.GetObject
-            my_etabs = getter(REMOTE_COMPUTER if REMOTE else "CSI.ETABS.API.ETABSObject")
+            etabs_object = getter(REMOTE_COMPUTER if REMOTE else "CSI.ETABS.API.ETABSObject")
             print("已成功附加到 ETABS 实例。")
         except COMException as e:
             sys.exit(f"致命错误: 附加到 ETABS 实例失败。COMException: {e}\n请确保 ETABS 正在运行。")
@@ -51,21 +69,32 @@ def setup_etabs():
                     helper.CreateObjectProgIDHost if REMOTE else \
                         helper.CreateObjectProgID
             path_or_progid = PROGRAM_PATH if SPECIFY_PATH else "CSI.ETABS.API.ETABSObject"
-            my_etabs = creator(REMOTE_COMPUTER if REMOTE else path_or_progid)
+            etabs_object = creator(REMOTE_COMPUTER if REMOTE else path_or_progid)
         except COMException as e:
             sys.exit(f"致命错误: 启动 ETABS实例失败。COMException: {e}\n请检查 PROGRAM_PATH 或 ProgID。")
         except Exception as e:
             sys.exit(f"致命错误: 启动 ETABS 实例时发生未知错误: {e}")
 
-        check_ret(my_etabs.ApplicationStart(), "my_etabs.ApplicationStart")
+        check_ret(etabs_object.ApplicationStart(), "my_etabs.ApplicationStart")
         print("ETABS 应用程序已启动。")
 
-    print("等待 ETABS 用户界面初始化 (大约5秒)...")
-    time.sleep(5)
+    return etabs_object
+
 
-    sap_model = my_etabs.SapModel
+def initialize_new_model():
+    """
+    在当前已连接的 ETABS 实例中初始化新的空白网格模型（不重新启动 ETABS）。
+    批量运行多个模型时，每个模型只需调用本函数。
+
+    Returns:
+        sap_model: 初始化后的 SapModel 对象
+    """
+    ETABSv1, _, _ = _api()
+
+    if ETABSv1 is None:
+        sys.exit("致命错误: ETABSv1 API 未正确加载")
     if sap_model is None:
-        sys.exit("致命错误: my_etabs.SapModel 返回为 None。")
+        sys.exit("致命错误: ETABS 尚未连接，请先运行 setup_etabs()")
 
     try:
         sap_model.SetModelIsLocked(False)
@@ -84,6 +113,33 @@ def setup_etabs():
     )
     print(f"空白网格模型已创建 ({NUM_STORIES}层, X向轴线: {NUM_GRID_LINES_X}, Y向轴线: {NUM_GRID_LINES_Y})。")
 
+    return sap_model
+
+
+def setup_etabs():
+    """设置ETABS连接与模型初始化；已有可响应的 ETABS 实例时直接复用，只初始化新模型"""
+    global my_etabs, sap_model
+
+    ETABSv1, System, COMException = _api()
+
+    if ETABSv1 is None:
+        sys.exit("致命错误: ETABSv1 API 未正确加载")
+
+    print("\nETABS 连接与模型初始化...")
+
+    invalidate_connection_cache()
+    if is_etabs_connected():
+        print("复用已连接的 ETABS 实例。")
+    else:
+        my_etabs = _start_or_attach_etabs(ETABSv1, COMException)
+
+        print(f"等待 ETABS 就绪 (最长 {_READY_TIMEOUT_SECONDS:.0f} 秒)...")
+        sap_model = _wait_for_sap_model(my_etabs)
+        if sap_model is None:
+            sys.exit("致命错误: my_etabs.SapModel 在等待时间内未就绪。")
+
+    initialize_new_model()
+
     return my_etabs, sap_model
 
 
@@ -117,6 +173,7 @@ def set_sap_model(model):
     """
     global sap_model
     sap_model = model
+    invalidate_connection_cache()
 
 
 def is_etabs_connected():
@@ -126,17 +183,33 @@ def is_etabs_connected():
     Returns:
         bool: True如果已连接，False如果未连接
     """
-    global my_etabs, sap_model
+    global my_etabs, sap_model, _last_ok_ts
     try:
         if my_etabs is None or sap_model is None:
             return False
+        # 最近一次探测成功且未超过 TTL：直接视为已连接，省去一次 COM 往返
+        if time.monotonic() - _last_ok_ts < _HEALTH_TTL:
+            return True
         # 尝试执行一个简单的操作来测试连接
         _ = sap_model.GetModelFilename()
+        _last_ok_ts = time.monotonic()
         return True
-    except:
+    except _com_errors():
+        _last_ok_ts = 0.0
+        return False
+    except Exception as exc:
+        # 非 COM 的意外异常同样视为未连接，但注明类型便于排查；KeyboardInterrupt 不再被吞掉
+        print(f"⚠️ ETABS 连接检查出现意外异常 ({type(exc).__name__}): {exc}")
+        _last_ok_ts = 0.0
         return False
 
 
+def invalidate_connection_cache():
+    """清除 is_etabs_connected() 的健康探测缓存，下次调用必定重新探测。"""
+    global _last_ok_ts
+    _last_ok_ts = 0.0
+
+
 def ensure_etabs_ready():
     """
     确保ETABS已准备就绪，如果未连接则尝试重新连接
@@ -148,6 +221,7 @@ def ensure_etabs_ready():
         return True
 
     print("🔄 ETABS连接丢失，尝试重新连接...")
+    invalidate_connection_cache()
     try:
         setup_etabs()
         return is_etabs_connected()
@@ -159,9 +233,11 @@ def ensure_etabs_ready():
 # 导出函数列表
 __all__ = [
     'setup_etabs',
+    'initialize_new_model',
     'get_etabs_objects',
     'get_sap_model',  # 新增
     'set_sap_model',  # 新增
     'is_etabs_connected',  # 新增
+    'invalidate_connection_cache',
     'ensure_etabs_ready'  # 新增
 ]
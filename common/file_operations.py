@@ -10,8 +10,20 @@ import shutil
 from pathlib import Path
 from .etabs_setup import get_etabs_objects
 from .utility_functions import check_ret
+from .etabs_api_loader import _api, _com_errors
 from .config import MODEL_PATH, SCRIPT_DIRECTORY, ATTACH_TO_INSTANCE
 
+# Directories already created/checked in this process; later requests skip the makedirs stat calls
+_ENSURED_DIRS = set()
+
+
+def _ensure_dir(path):
+    """os.makedirs(path, exist_ok=True) at most once per process for each path."""
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
+
 
 def finalize_and_save_model():
     """Refresh view (best effort), ensure output dir, and save the model."""
@@ -24,8 +36,7 @@ def finalize_and_save_model():
 
     # 1) Refresh view (optional)
     try:
-        from .etabs_api_loader import get_api_objects
-        ETABSv1, System, COMException = get_api_objects()
+        ETABSv1, System, COMException = _api()
         if ETABSv1 is not None:
             check_ret(
                 ETABSv1.cView(sap_model.View).RefreshView(0, False),
@@ -35,20 +46,21 @@ def finalize_and_save_model():
             print("Model view refreshed.")
         else:
             print("Skip view refresh (ETABS API not available).")
-    except Exception as e:
+    except _com_errors() as e:
         print(f"View refresh failed (non-critical): {e}")
+    except Exception as e:
+        print(f"View refresh failed with unexpected {type(e).__name__} (non-critical): {e}")
 
     # 2) Ensure output directory
     try:
-        os.makedirs(SCRIPT_DIRECTORY, exist_ok=True)
+        _ensure_dir(SCRIPT_DIRECTORY)
         print(f"输出目录已确保存在: {SCRIPT_DIRECTORY}")
     except Exception as e:
         sys.exit(f"创建输出目录失败: {e}")
 
     # 3) Save model
     try:
-        from .etabs_api_loader import get_api_objects
-        ETABSv1, System, COMException = get_api_objects()
+        ETABSv1, System, COMException = _api()
         if ETABSv1 is None:
             sys.exit("致命错误: ETABS API 不可用，无法保存模型")
 
@@ -68,8 +80,10 @@ def finalize_and_save_model():
         if not ATTACH_TO_INSTANCE and my_etabs is not None:
             try:
                 my_etabs.ApplicationExit(False)
-            except Exception:
-                pass
+            except _com_errors():
+                pass  # ETABS 已无响应或已退出
+            except Exception as exit_exc:
+                print(f"关闭 ETABS 时出现意外异常 ({type(exit_exc).__name__}): {exit_exc}")
         sys.exit(f"保存模型失败: {e}")
 
 
@@ -88,7 +102,7 @@ def cleanup_etabs_on_error():
 def check_output_directory():
     """Ensure output directory exists."""
     try:
-        os.makedirs(SCRIPT_DIRECTORY, exist_ok=True)
+        _ensure_dir(SCRIPT_DIRECTORY)
         print(f"输出目录: {SCRIPT_DIRECTORY}")
         return True
     except Exception as e:
@@ -5,9 +5,32 @@ ETABS 实用工具函数
 包含错误检查、数组转换等通用功能
 """
 
+import array
+import re
 import sys
 from typing import List, Any, Tuple, Union
 
+from .etabs_api_loader import _api
+
+
+# 允许返回 1 的 API 名称关键字（模块级常量，避免每次调用 check_ret 重建列表）
+_RET1_ALLOWED_KEYWORDS = (
+    "SetNumberModes", "SetMaterial", "SetWall", "SetSlab",
+    "SetRectangle", "SetCase", "Add(", "AddByCoord", "SetDiaphragm",
+    "SetPier", "SetSpandrel", "SetSelfWTMultiplier", "SetLoadUniform",
+    "SetRunCaseFlag", "DeselectAllCasesAndCombosForOutput",
+    "SetCaseSelectedForOutput", "Drift", "SetLoadDistributed",
+    "SetModifiers",  # 刚度修正
+    # 结果提取相关函数允许返回1（表示无结果或数据不可用）
+    "Results.ModalPeriod", "Results.ModalParticipatingMassRatios",
+    "Results.StoryDrifts", "Results.", "ModalPeriod", "ModalParticipatingMassRatios",
+    "StoryDrifts", "GetNameList", "RefreshView",
+)
+_RET1_RESULT_KEYWORDS = ("ModalPeriod", "StoryDrifts", "ModalParticipatingMassRatios")
+# 关键字预编译为单个正则交替式：一次扫描 func_name 代替逐个关键字子串查找
+_RET1_ALLOWED_RE = re.compile("|".join(map(re.escape, _RET1_ALLOWED_KEYWORDS)))
+_RET1_RESULT_RE = re.compile("|".join(map(re.escape, ("Results.",) + _RET1_RESULT_KEYWORDS)))
+
 
 def check_ret(ret_val, func_name, ok_codes=(0,)):
     """
@@ -19,9 +42,7 @@ def check_ret(ret_val, func_name, ok_codes=(0,)):
     func_name : str      用于报错 / 日志
     ok_codes  : tuple    允许的返回码，默认 (0,)
     """
-    # 动态导入System以避免循环导入
-    from .etabs_api_loader import get_api_objects
-    ETABSv1, System, COMException = get_api_objects()
+    ETABSv1, System, COMException = _api()
 
     if System is None:
         sys.exit("System module missing in check_ret")
@@ -29,23 +50,8 @@ def check_ret(ret_val, func_name, ok_codes=(0,)):
     code = ret_val[0] if isinstance(ret_val, tuple) and len(ret_val) > 0 else ret_val
 
     # 允许特定函数返回1（对象已存在/数值未改变）
-    if code == 1 and any(
-            kw in func_name
-            for kw in [
-                "SetNumberModes", "SetMaterial", "SetWall", "SetSlab",
-                "SetRectangle", "SetCase", "Add(", "AddByCoord", "SetDiaphragm",
-                "SetPier", "SetSpandrel", "SetSelfWTMultiplier", "SetLoadUniform",
-                "SetRunCaseFlag", "DeselectAllCasesAndCombosForOutput",
-                "SetCaseSelectedForOutput", "Drift", "SetLoadDistributed",
-                "SetModifiers",  # 刚度修正
-                # 新增：结果提取相关函数允许返回1（表示无结果或数据不可用）
-                "Results.ModalPeriod", "Results.ModalParticipatingMassRatios",
-                "Results.StoryDrifts", "Results.", "ModalPeriod", "ModalParticipatingMassRatios",
-                "StoryDrifts", "GetNameList", "RefreshView",
-            ]
-    ):
-        if "Results." in func_name or any(
-                x in func_name for x in ["ModalPeriod", "StoryDrifts", "ModalParticipatingMassRatios"]):
+    if code == 1 and _RET1_ALLOWED_RE.search(func_name):
+        if _RET1_RESULT_RE.search(func_name):
             print(f"信息: {func_name} 返回 1（可能无结果数据），将继续处理。")
         else:
             print(f"信息: {func_name} 返回 1（对象已存在 / 数值未改变），脚本继续。")
@@ -62,17 +68,66 @@ def check_ret(ret_val, func_name, ok_codes=(0,)):
     return code
 
 
+_marshal = None
+
+
+def _get_marshal():
+    """System.Runtime.InteropServices.Marshal, imported on first use (False if unavailable)."""
+    global _marshal
+    if _marshal is None:
+        try:
+            from System.Runtime.InteropServices import Marshal
+            _marshal = Marshal
+        except Exception:  # noqa: BLE001
+            _marshal = False
+    return _marshal
+
+
+_EMPTY_ARRAYS = None
+
+
+def _empty_arrays():
+    """
+    共享的零长度 (String[], Double[], Int32[]) 占位数组，进程内只创建一次。
+    ETABS 会为 ref/out 数组参数重新分配结果，调用方无需每次新建。
+    """
+    global _EMPTY_ARRAYS
+    if _EMPTY_ARRAYS is None:
+        ETABSv1, System, COMException = _api()
+        if System is None:
+            sys.exit("System module missing in _empty_arrays")
+        _EMPTY_ARRAYS = (
+            System.Array.CreateInstance(System.String, 0),
+            System.Array.CreateInstance(System.Double, 0),
+            System.Array.CreateInstance(System.Int32, 0),
+        )
+    return _EMPTY_ARRAYS
+
+
 def arr(py_list: List[Any], sys_type=None):
     """将Python列表转换为.NET数组"""
-    # 动态导入System以避免循环导入
-    from .etabs_api_loader import get_api_objects
-    ETABSv1, System, COMException = get_api_objects()
+    ETABSv1, System, COMException = _api()
 
     if System is None:
         sys.exit("System module missing in arr")
     if sys_type is None:
         sys_type = System.Double
-    a = System.Array[sys_type](len(py_list))
+    n = len(py_list)
+    a = System.Array[sys_type](n)
+
+    # Double/Int32: pack into a contiguous buffer and block-copy it with one Marshal.Copy
+    # instead of one CLR index assignment per element
+    marshal = _get_marshal()
+    typecode = "d" if sys_type == System.Double else "i" if sys_type == System.Int32 else None
+    if marshal and typecode and n:
+        try:
+            buf = array.array(typecode, py_list)
+        except (TypeError, OverflowError):
+            buf = None
+        if buf is not None:
+            marshal.Copy(System.IntPtr(buf.buffer_info()[0]), a, 0, n)
+            return a
+
     for i, val in enumerate(py_list):
         a[i] = val
     return a
@@ -82,9 +137,7 @@ def add_frame_by_coord_custom(frame_object_api, x1: float, y1: float, z1: float,
                               x2: float, y2: float, z2: float, prop_name: str,
                               user_name_in: str, csys: str = "Global") -> Tuple[int, str]:
     """自定义框架对象创建函数"""
-    # 动态导入System
-    from .etabs_api_loader import get_api_objects
-    ETABSv1, System, COMException = get_api_objects()
+    ETABSv1, System, COMException = _api()
 
     etabs_assigned_name_ref = System.String("")
     ret_tuple = frame_object_api.AddByCoord(x1, y1, z1, x2, y2, z2,
@@ -117,12 +170,14 @@ def add_area_by_coord_custom(area_object_api, num_points: int, x_coords_py: List
                              prop_name: str, user_name_in: str,
                              csys: str = "Global") -> Tuple[int, str]:
     """自定义面对象创建函数"""
-    # 动态导入System
-    from .etabs_api_loader import get_api_objects
-    ETABSv1, System, COMException = get_api_objects()
+    ETABSv1, System, COMException = _api()
 
     etabs_assigned_name_ref = System.String("")
-    x_api, y_api, z_api = arr(x_coords_py), arr(y_coords_py), arr(z_coords_py)
+    # 调用方可传入预先构建并跨调用复用的 .NET 数组，此时不再逐次转换
+    x_api, y_api, z_api = (
+        coords if isinstance(coords, System.Array) else arr(coords)
+        for coords in (x_coords_py, y_coords_py, z_coords_py)
+    )
     ret_tuple = area_object_api.AddByCoord(num_points, x_api, y_api, z_api,
                                            etabs_assigned_name_ref, prop_name,
                                            user_name_in, csys)
@@ -28,7 +28,8 @@ def _require_sap_model():
 def ensure_model_units() -> bool:
     sap_model = _require_sap_model()
     try:
-        current_units = sap_model.GetPresentUnits()
+        # pythonnet 3 returns a .NET enum that does not compare equal to a plain int
+        current_units = int(sap_model.GetPresentUnits())
         KNM_ENUM = 6  # ETABS eUnits.kN_m_C
 
         if current_units == KNM_ENUM:
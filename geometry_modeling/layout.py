@@ -5,7 +5,10 @@ Grid and story layout definitions for geometry modeling.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from functools import cached_property, lru_cache
+from itertools import product
+from types import MappingProxyType
+from typing import Iterable, Mapping, Tuple
 
 from common.config import SETTINGS
 
@@ -17,39 +20,73 @@ class GridConfig:
     spacing_x: float
     spacing_y: float
 
-    @property
-    def x_coords(self) -> List[float]:
-        return [i * self.spacing_x for i in range(self.num_x)]
+    # Computed once per instance; cached_property stores into __dict__ directly, so frozen=True is fine
+    @cached_property
+    def x_coords(self) -> Tuple[float, ...]:
+        return tuple(i * self.spacing_x for i in range(self.num_x))
 
-    @property
-    def y_coords(self) -> List[float]:
-        return [j * self.spacing_y for j in range(self.num_y)]
+    @cached_property
+    def y_coords(self) -> Tuple[float, ...]:
+        return tuple(j * self.spacing_y for j in range(self.num_y))
 
-    def iter_points(self) -> Iterable[Tuple[int, int, float, float]]:
-        for i, x in enumerate(self.x_coords):
-            for j, y in enumerate(self.y_coords):
-                yield i, j, x, y
+    @cached_property
+    def points(self) -> Tuple[Tuple[int, int, float, float], ...]:
+        return tuple((i, j, x, y) for (i, x), (j, y) in product(enumerate(self.x_coords), enumerate(self.y_coords)))
 
-    def iter_beam_spans_x(self) -> Iterable[Tuple[int, int, float, float, float]]:
+    @cached_property
+    def beam_spans_x(self) -> Tuple[Tuple[int, int, float, float, float], ...]:
         xs = self.x_coords
+        return tuple(
+            (i, j, xs[i], xs[i + 1], y) for j, y in enumerate(self.y_coords) for i in range(len(xs) - 1)
+        )
+
+    @cached_property
+    def beam_spans_y(self) -> Tuple[Tuple[int, int, float, float, float], ...]:
         ys = self.y_coords
-        for j, y in enumerate(ys):
-            for i in range(len(xs) - 1):
-                yield i, j, xs[i], xs[i + 1], y
+        return tuple(
+            (i, j, x, ys[j], ys[j + 1]) for i, x in enumerate(self.x_coords) for j in range(len(ys) - 1)
+        )
 
-    def iter_beam_spans_y(self) -> Iterable[Tuple[int, int, float, float, float]]:
+    @cached_property
+    def slab_panels(self) -> Tuple[Tuple[int, int, Tuple[float, float], Tuple[float, float]], ...]:
         xs = self.x_coords
         ys = self.y_coords
-        for i, x in enumerate(xs):
-            for j in range(len(ys) - 1):
-                yield i, j, x, ys[j], ys[j + 1]
+        return tuple(
+            (i, j, (xs[i], xs[i + 1]), (ys[j], ys[j + 1])) for i in range(len(xs) - 1) for j in range(len(ys) - 1)
+        )
+
+    # The iter_* API is kept for callers; each walks the precomputed table above
+    def iter_points(self) -> Iterable[Tuple[int, int, float, float]]:
+        return iter(self.points)
+
+    def iter_beam_spans_x(self) -> Iterable[Tuple[int, int, float, float, float]]:
+        return iter(self.beam_spans_x)
+
+    def iter_beam_spans_y(self) -> Iterable[Tuple[int, int, float, float, float]]:
+        return iter(self.beam_spans_y)
 
     def iter_slab_panels(self) -> Iterable[Tuple[int, int, Tuple[float, float], Tuple[float, float]]]:
-        xs = self.x_coords
-        ys = self.y_coords
-        for i in range(len(xs) - 1):
-            for j in range(len(ys) - 1):
-                yield i, j, (xs[i], xs[i + 1]), (ys[j], ys[j + 1])
+        return iter(self.slab_panels)
+
+
+@lru_cache(maxsize=64)
+def _story_bounds(num_stories: int, typical_height: float, bottom_height: float) -> Tuple[Tuple[int, float, float], ...]:
+    """(story number, z_bottom, z_top) for every story, built once per story layout."""
+    bounds = []
+    z = 0.0
+    for idx in range(num_stories):
+        height = typical_height if idx > 0 else bottom_height
+        bounds.append((idx + 1, z, z + height))
+        z += height
+    return tuple(bounds)
+
+
+@lru_cache(maxsize=64)
+def _story_tops(num_stories: int, typical_height: float, bottom_height: float) -> Mapping[int, float]:
+    """Story number -> top elevation, derived once per story layout from _story_bounds (read-only view)."""
+    return MappingProxyType(
+        {story_num: z_top for story_num, _, z_top in _story_bounds(num_stories, typical_height, bottom_height)}
+    )
 
 
 @dataclass(frozen=True)
@@ -60,19 +97,11 @@ class StoryConfig:
     beam_height: float
 
     def iter_story_bounds(self) -> Iterable[Tuple[int, float, float]]:
-        z = 0.0
-        for idx in range(self.num_stories):
-            height = self.typical_height if idx > 0 else self.bottom_height
-            z_bottom = z
-            z_top = z + height
-            z = z_top
-            yield idx + 1, z_bottom, z_top
-
-    def story_top_elevations(self) -> Dict[int, float]:
-        tops: Dict[int, float] = {}
-        for story_num, _, z_top in self.iter_story_bounds():
-            tops[story_num] = z_top
-        return tops
+        return iter(_story_bounds(self.num_stories, self.typical_height, self.bottom_height))
+
+    def story_top_elevations(self) -> Mapping[int, float]:
+        # Shared read-only mapping; callers that need to edit it should take a dict() copy
+        return _story_tops(self.num_stories, self.typical_height, self.bottom_height)
 
 
 def default_grid_config() -> GridConfig:
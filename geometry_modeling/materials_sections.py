@@ -19,30 +19,32 @@ def define_materials():
 
     print("\nDefining concrete material...")
     pm = sap_model.PropMaterial
+    sec = SETTINGS.sections
+    material = sec.concrete_material_name
 
     check_ret(
-        pm.SetMaterial(SETTINGS.sections.concrete_material_name, ETABSv1.eMatType.Concrete),
-        f"SetMaterial({SETTINGS.sections.concrete_material_name})",
+        pm.SetMaterial(material, ETABSv1.eMatType.Concrete),
+        f"SetMaterial({material})",
         (0, 1),
     )
     check_ret(
         pm.SetMPIsotropic(
-            SETTINGS.sections.concrete_material_name,
-            SETTINGS.sections.concrete_e_modulus,
-            SETTINGS.sections.concrete_poisson,
-            SETTINGS.sections.concrete_thermal_exp,
+            material,
+            sec.concrete_e_modulus,
+            sec.concrete_poisson,
+            sec.concrete_thermal_exp,
         ),
-        f"SetMPIsotropic({SETTINGS.sections.concrete_material_name})",
+        f"SetMPIsotropic({material})",
     )
     check_ret(
         pm.SetWeightAndMass(
-            SETTINGS.sections.concrete_material_name,
+            material,
             1,
-            SETTINGS.sections.concrete_unit_weight,
+            sec.concrete_unit_weight,
         ),
-        f"SetWeightAndMass({SETTINGS.sections.concrete_material_name})",
+        f"SetWeightAndMass({material})",
     )
-    print(f"Concrete material '{SETTINGS.sections.concrete_material_name}' defined")
+    print(f"Concrete material '{material}' defined")
 
 
 def define_frame_sections():
@@ -52,35 +54,37 @@ def define_frame_sections():
 
     print("\nDefining frame sections...")
     pf = sap_model.PropFrame
+    sec = SETTINGS.sections
+    material = sec.concrete_material_name
 
     check_ret(
         pf.SetRectangle(
-            SETTINGS.sections.frame_beam_section_name,
-            SETTINGS.sections.concrete_material_name,
-            SETTINGS.sections.frame_beam_height,
-            SETTINGS.sections.frame_beam_width,
+            sec.frame_beam_section_name,
+            material,
+            sec.frame_beam_height,
+            sec.frame_beam_width,
         ),
-        f"SetRectangle({SETTINGS.sections.frame_beam_section_name})",
+        f"SetRectangle({sec.frame_beam_section_name})",
         (0, 1),
     )
     print(
-        f"Beam section '{SETTINGS.sections.frame_beam_section_name}' defined "
-        f"({SETTINGS.sections.frame_beam_width:.2f}m × {SETTINGS.sections.frame_beam_height:.2f}m)"
+        f"Beam section '{sec.frame_beam_section_name}' defined "
+        f"({sec.frame_beam_width:.2f}m × {sec.frame_beam_height:.2f}m)"
     )
 
     check_ret(
         pf.SetRectangle(
-            SETTINGS.sections.frame_column_section_name,
-            SETTINGS.sections.concrete_material_name,
-            SETTINGS.sections.frame_column_height,
-            SETTINGS.sections.frame_column_width,
+            sec.frame_column_section_name,
+            material,
+            sec.frame_column_height,
+            sec.frame_column_width,
         ),
-        f"SetRectangle({SETTINGS.sections.frame_column_section_name})",
+        f"SetRectangle({sec.frame_column_section_name})",
         (0, 1),
     )
     print(
-        f"Column section '{SETTINGS.sections.frame_column_section_name}' defined "
-        f"({SETTINGS.sections.frame_column_width:.2f}m × {SETTINGS.sections.frame_column_height:.2f}m)"
+        f"Column section '{sec.frame_column_section_name}' defined "
+        f"({sec.frame_column_width:.2f}m × {sec.frame_column_height:.2f}m)"
     )
 
 
@@ -94,21 +98,23 @@ def define_slab_sections():
 
     print("\nDefining slab section...")
     pa = sap_model.PropArea
+    sec = SETTINGS.sections
+    material = sec.concrete_material_name
 
     check_ret(
         pa.SetSlab(
-            SETTINGS.sections.slab_section_name,
+            sec.slab_section_name,
             ETABSv1.eSlabType.Slab,
             ETABSv1.eShellType.Membrane,
-            SETTINGS.sections.concrete_material_name,
-            SETTINGS.sections.slab_thickness,
+            material,
+            sec.slab_thickness,
         ),
-        f"SetSlab({SETTINGS.sections.slab_section_name})",
+        f"SetSlab({sec.slab_section_name})",
         (0, 1),
     )
     print(
-        f"Slab section '{SETTINGS.sections.slab_section_name}' defined "
-        f"(thickness: {SETTINGS.sections.slab_thickness:.2f}m, material: {SETTINGS.sections.concrete_material_name})"
+        f"Slab section '{sec.slab_section_name}' defined "
+        f"(thickness: {sec.slab_thickness:.2f}m, material: {material})"
     )
 
 
@@ -5,7 +5,7 @@ Geometry modeling workflow for ETABS frame structures.
 """
 
 import logging
-from typing import Dict, List, Tuple
+from typing import List, Mapping, Tuple
 
 from common.config import (
     FRAME_BEAM_SECTION_NAME,
@@ -13,7 +13,7 @@ from common.config import (
     SLAB_SECTION_NAME,
 )
 from common.etabs_setup import get_etabs_objects
-from common.utility_functions import add_area_by_coord_custom, add_frame_by_coord_custom, check_ret
+from common.utility_functions import add_area_by_coord_custom, add_frame_by_coord_custom, arr, check_ret
 
 from .api_compat import _require_sap_model, ensure_model_units
 from .base_constraints import (
@@ -43,10 +43,12 @@ class ElementCreator:
 
     def create_columns(self) -> List[str]:
         column_names: List[str] = []
+        # Grid positions and the story-independent part of each name are the same on every story
+        column_sites = [(f"COL_X{i}_Y{j}_S", x, y) for i, j, x, y in self.grid.iter_points()]
         for story_num, z_bottom, z_top in self.stories.iter_story_bounds():
             story_count = 0
-            for i, j, x_coord, y_coord in self.grid.iter_points():
-                column_name = f"COL_X{i}_Y{j}_S{story_num}"
+            for name_prefix, x_coord, y_coord in column_sites:
+                column_name = f"{name_prefix}{story_num}"
                 ret_code, actual_name = add_frame_by_coord_custom(
                     self.frame_obj,
                     x_coord,
@@ -70,14 +72,16 @@ class ElementCreator:
     def create_beams(self) -> List[str]:
         beam_names: List[str] = []
         beam_half_height = self.stories.beam_height / 2.0
+        x_spans = [(f"BEAM_X_X{i}to{i + 1}_Y{j}_S", x1, x2, y) for i, j, x1, x2, y in self.grid.iter_beam_spans_x()]
+        y_spans = [(f"BEAM_Y_X{i}_Y{j}to{j + 1}_S", x, y1, y2) for i, j, x, y1, y2 in self.grid.iter_beam_spans_y()]
 
         for story_num, _, z_top in self.stories.iter_story_bounds():
             z_beam_center = z_top - beam_half_height
 
             story_beam_count = 0
 
-            for i, j, x1, x2, y in self.grid.iter_beam_spans_x():
-                beam_name = f"BEAM_X_X{i}to{i + 1}_Y{j}_S{story_num}"
+            for name_prefix, x1, x2, y in x_spans:
+                beam_name = f"{name_prefix}{story_num}"
                 ret_code, actual_name = add_frame_by_coord_custom(
                     self.frame_obj,
                     x1,
@@ -93,8 +97,8 @@ class ElementCreator:
                 beam_names.append(actual_name or beam_name)
                 story_beam_count += 1
 
-            for i, j, x, y1, y2 in self.grid.iter_beam_spans_y():
-                beam_name = f"BEAM_Y_X{i}_Y{j}to{j + 1}_S{story_num}"
+            for name_prefix, x, y1, y2 in y_spans:
+                beam_name = f"{name_prefix}{story_num}"
                 ret_code, actual_name = add_frame_by_coord_custom(
                     self.frame_obj,
                     x,
@@ -117,14 +121,18 @@ class ElementCreator:
 
     def create_slabs(self) -> List[str]:
         slab_names: List[str] = []
+        # Panel outlines in plan do not change between stories; only the elevation does.
+        # The .NET coordinate arrays are built once here and reused for every story.
+        panels = [
+            (f"SLAB_X{i}_Y{j}_S", arr([x1, x2, x2, x1]), arr([y1, y1, y2, y2]))
+            for i, j, (x1, x2), (y1, y2) in self.grid.iter_slab_panels()
+        ]
 
         for story_num, _, z_top in self.stories.iter_story_bounds():
             story_slab_count = 0
-            for i, j, (x1, x2), (y1, y2) in self.grid.iter_slab_panels():
-                slab_name = f"SLAB_X{i}_Y{j}_S{story_num}"
-                slab_x = [x1, x2, x2, x1]
-                slab_y = [y1, y1, y2, y2]
-                slab_z = [z_top] * 4
+            slab_z = arr([z_top] * 4)
+            for name_prefix, slab_x, slab_y in panels:
+                slab_name = f"{name_prefix}{story_num}"
 
                 ret_code, actual_name = add_area_by_coord_custom(
                     self.area_obj,
@@ -158,7 +166,7 @@ class FrameGeometryWorkflow:
         self.stories = stories
         self.creator = ElementCreator(sap_model, grid, stories)
 
-    def build(self) -> Tuple[List[str], List[str], List[str], Dict[int, float]]:
+    def build(self) -> Tuple[List[str], List[str], List[str], Mapping[int, float]]:
         ensure_model_units()
 
         column_names = self.creator.create_columns()
@@ -199,7 +207,7 @@ class FrameGeometryWorkflow:
         return column_names, beam_names, slab_names, story_heights
 
 
-def create_frame_structure() -> Tuple[List[str], List[str], List[str], Dict[int, float]]:
+def create_frame_structure() -> Tuple[List[str], List[str], List[str], Mapping[int, float]]:
     sap_model = _require_sap_model()
     workflow = FrameGeometryWorkflow(sap_model, default_grid_config(), default_story_config())
     return workflow.build()
@@ -7,9 +7,12 @@
 
 from typing import List
 from common.etabs_setup import get_etabs_objects
-from common.utility_functions import check_ret
+from common.etabs_api_loader import get_api_objects
 from common.config import SETTINGS
 
+# 荷载赋值 API 的可接受返回码（1 表示数值未改变）
+_LOAD_OK_CODES = (0, 1)
+
 # 柱轴向荷载参数（kN，压缩为正）
 COLUMN_AXIAL_LOAD = 0  # 每根柱的轴向荷载
 ENABLE_FRAME_COLUMNS = True  # 是否启用柱荷载
@@ -39,45 +42,37 @@ def assign_dead_and_live_loads_to_slabs(
     print(f"\n为楼板分配荷载...")
     print(f"恒荷载: {dead_kpa} kN/m², 活荷载: {live_kpa} kN/m²")
 
-    area_obj = sap_model.AreaObj
-
     if not slab_names:
         print("警告: 未找到楼板名称列表。")
         return
 
+    ETABSv1, _, _ = get_api_objects()
+    if ETABSv1 is None:
+        print("  错误: ETABSv1 API对象为None，跳过楼板荷载分配")
+        return
+
     success_count = 0
     fail_count = 0
 
-    for slab_name in slab_names:
-        try:
-            # 动态导入API对象
-            from common.etabs_api_loader import get_api_objects
-            ETABSv1, System, COMException = get_api_objects()
-
-            if ETABSv1 is None:
-                print(f"  错误: ETABSv1 API对象为None，跳过楼板 '{slab_name}'")
+    # API 对象、方法与荷载值在循环外解析一次；逐块只检查返回码，异常只在外层处理
+    set_load_uniform = sap_model.AreaObj.SetLoadUniform
+    item_type = ETABSv1.eItemType.Objects
+    dead_value, live_value = abs(dead_kpa), abs(live_kpa)
+
+    try:
+        for slab_name in slab_names:
+            # 分配恒荷载、活荷载（向下为正）
+            ret_dead = set_load_uniform(slab_name, "DEAD", dead_value, 10, True, "Global", item_type)
+            ret_live = set_load_uniform(slab_name, "LIVE", live_value, 10, True, "Global", item_type)
+
+            if ret_dead in _LOAD_OK_CODES and ret_live in _LOAD_OK_CODES:
+                success_count += 1
+            else:
+                print(f"  错误: 楼板 '{slab_name}' 荷载分配失败，返回码: DEAD={ret_dead}, LIVE={ret_live}")
                 fail_count += 1
-                continue
-
-            # 分配恒荷载（向下为正）
-            ret_dead = area_obj.SetLoadUniform(
-                slab_name, "DEAD", abs(dead_kpa), 10, True, "Global",
-                ETABSv1.eItemType.Objects
-            )
-            check_ret(ret_dead, f"SetLoadUniform DEAD on {slab_name}", (0, 1))
-
-            # 分配活荷载（向下为正）
-            ret_live = area_obj.SetLoadUniform(
-                slab_name, "LIVE", abs(live_kpa), 10, True, "Global",
-                ETABSv1.eItemType.Objects
-            )
-            check_ret(ret_live, f"SetLoadUniform LIVE on {slab_name}", (0, 1))
-
-            success_count += 1
-
-        except Exception as e:
-            print(f"  错误: 楼板 '{slab_name}' 荷载分配失败: {e}")
-            fail_count += 1
+    except Exception as e:
+        print(f"  错误: 楼板荷载分配中断: {e}")
+        fail_count = len(slab_names) - success_count
 
     print(f"楼板荷载分配完成: 成功 {success_count} 块, 失败 {fail_count} 块")
 
@@ -103,39 +98,37 @@ def assign_finish_loads_to_beams(
     print(f"\n为框架梁分配面层荷载...")
     print(f"面层荷载: {finish_load} kN/m")
 
-    frame_obj = sap_model.FrameObj
-
     if not beam_names:
         print("警告: 未找到梁名称列表。")
         return
 
+    ETABSv1, _, _ = get_api_objects()
+    if ETABSv1 is None:
+        print("  错误: ETABSv1 API对象为None，跳过梁面层荷载分配")
+        return
+
     success_count = 0
     fail_count = 0
 
-    for beam_name in beam_names:
-        try:
-            # 动态导入API对象
-            from common.etabs_api_loader import get_api_objects
-            ETABSv1, System, COMException = get_api_objects()
-
-            if ETABSv1 is None:
-                print(f"  错误: ETABSv1 API对象为None，跳过梁 '{beam_name}'")
-                fail_count += 1
-                continue
+    set_load_distributed = sap_model.FrameObj.SetLoadDistributed
+    item_type = ETABSv1.eItemType.Objects
+    load_value = abs(finish_load)
 
+    try:
+        for beam_name in beam_names:
             # 分配均布线荷载到梁（向下为正）
-            ret = frame_obj.SetLoadDistributed(
+            ret = set_load_distributed(
                 beam_name, "DEAD", 1, 10, 0.0, 1.0,
-                abs(finish_load), abs(finish_load), "Global", True, True,
-                ETABSv1.eItemType.Objects
+                load_value, load_value, "Global", True, True, item_type
             )
-            check_ret(ret, f"SetLoadDistributed on {beam_name}", (0, 1))
-
-            success_count += 1
-
-        except Exception as e:
-            print(f"  错误: 梁 '{beam_name}' 面层荷载分配失败: {e}")
-            fail_count += 1
+            if ret in _LOAD_OK_CODES:
+                success_count += 1
+            else:
+                print(f"  错误: 梁 '{beam_name}' 面层荷载分配失败，返回码: {ret}")
+                fail_count += 1
+    except Exception as e:
+        print(f"  错误: 梁面层荷载分配中断: {e}")
+        fail_count = len(beam_names) - success_count
 
     print(f"梁面层荷载分配完成: 成功 {success_count} 根, 失败 {fail_count} 根")
 
@@ -161,36 +154,35 @@ def assign_column_loads_fixed(column_names: List[str]):
     print(f"\n为框架柱分配轴向荷载...")
     print(f"轴向荷载: {COLUMN_AXIAL_LOAD} kN (压缩)")
 
-    frame_obj = sap_model.FrameObj
+    ETABSv1, _, _ = get_api_objects()
+    if ETABSv1 is None:
+        print("  错误: ETABSv1 API对象为None，跳过柱荷载分配")
+        return
+
     column_load_count = 0
     failed_columns = []
 
     # 荷载值为负表示压缩
     load_value = -abs(float(COLUMN_AXIAL_LOAD))
+    set_load_point = sap_model.FrameObj.SetLoadPoint
+    item_type = ETABSv1.eItemType.Objects
 
     # API 调用: SetLoadPoint(Name, LoadPat, Type, Dir, Dist, Val, CSys, Replace, ItemType)
     # Type=1 (Force), Dir=1 (Local-1, Axial), CSys="Local", Replace=True
-    for column_name in column_names:
-        try:
-            # 动态导入API对象
-            from common.etabs_api_loader import get_api_objects
-            ETABSv1, System, COMException = get_api_objects()
-
-            if ETABSv1 is None:
-                print(f"  错误: ETABSv1 API对象为None，跳过柱 '{column_name}'")
-                failed_columns.append(column_name)
-                continue
-
-            ret = frame_obj.SetLoadPoint(
+    try:
+        for column_name in column_names:
+            ret = set_load_point(
                 column_name, "DEAD", 1, 1, 1.0, load_value,
-                "Local", True, True, ETABSv1.eItemType.Objects
+                "Local", True, True, item_type
             )
-            check_ret(ret, f"SetLoadPoint DEAD on {column_name}", (0, 1))
-            column_load_count += 1
-
-        except Exception as e:
-            print(f"  错误: 柱 '{column_name}' 荷载分配失败: {e}")
-            failed_columns.append(column_name)
+            if ret in _LOAD_OK_CODES:
+                column_load_count += 1
+            else:
+                print(f"  错误: 柱 '{column_name}' 荷载分配失败，返回码: {ret}")
+                failed_columns.append(column_name)
+    except Exception as e:
+        print(f"  错误: 柱荷载分配中断: {e}")
+        failed_columns = column_names[column_load_count + len(failed_columns):] + failed_columns
 
     print(f"柱轴向荷载分配完成: 成功 {column_load_count} 根, 失败 {len(failed_columns)} 根")
 
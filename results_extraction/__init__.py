@@ -31,7 +31,7 @@ from .member_forces import (
     extract_frame_forces,
     save_forces_to_csv,
 )
-from common.config import SCRIPT_DIRECTORY
+from common.config import script_directory_path
 from common.etabs_setup import get_etabs_objects
 from .concrete_frame_detail_data import (
     extract_all_concrete_design_data,
@@ -57,7 +57,7 @@ def extract_all_analysis_results(
     sap_model=None,
 ):
     """Extract analysis results and write the summary workbook."""
-    output_directory = Path(output_dir) if output_dir is not None else Path(SCRIPT_DIRECTORY)
+    output_directory = Path(output_dir) if output_dir is not None else script_directory_path()
     if sap_model is None:
         _, sap_model = get_etabs_objects()
 
@@ -52,6 +52,9 @@ _STORY_DRIFT_HEADERS = [
     "Z",
 ]
 
+# ETABS 层间位移方向标签 -> 汇总方向键
+_DRIFT_DIRECTION_KEYS = {"X": "X", "UX": "X", "U1": "X", "Y": "Y", "UY": "Y", "U2": "Y"}
+
 
 def _is_number(s: str) -> bool:
     """判断字符串是否是一个可以用 float 转换的数字。"""
@@ -345,34 +348,37 @@ def capture_stdout_to_buffer():
         sys.stdout = old_stdout
 
 
+# 过滤模态/位移角输出时保留的关键字行（模块级常量，逐行过滤时不再重建列表）
+_IMPORTANT_LINE_KEYWORDS = (
+    "开始提取模态信息和质量参与系数",
+    "模态周期和频率",
+    "模态参与质量系数",
+    "最终累积质量参与系数",
+    "开始提取相对层间位移角",
+    "层间位移角提取完毕",
+    "T2/T1 =",
+    "T3/T2 =",
+    "SumUX:",
+    "SumUY:",
+    "SumUZ:",
+    "SumRX:",
+    "SumRY:",
+    "SumRZ:",
+    "=== 最大层间位移角总结 ===",
+    "最大位移角:",
+    "位置:",
+    "满足建议限值",
+    "⚠️  警告",
+)
+
+
 def _is_important_line(line: str) -> bool:
     line = (line or "").strip()
     if not line:
         return False
     if any(ch.isdigit() for ch in line):
         return True
-    keywords = [
-        "开始提取模态信息和质量参与系数",
-        "模态周期和频率",
-        "模态参与质量系数",
-        "最终累积质量参与系数",
-        "开始提取相对层间位移角",
-        "层间位移角提取完毕",
-        "T2/T1 =",
-        "T3/T2 =",
-        "SumUX:",
-        "SumUY:",
-        "SumUZ:",
-        "SumRX:",
-        "SumRY:",
-        "SumRZ:",
-        "=== 最大层间位移角总结 ===",
-        "最大位移角:",
-        "位置:",
-        "满足建议限值",
-        "⚠️  警告",
-    ]
-    return any(k in line for k in keywords)
+    return any(k in line for k in _IMPORTANT_LINE_KEYWORDS)
 
 
 def extract_modal_and_mass_info(sap_model) -> None:
@@ -814,14 +820,9 @@ def extract_story_drifts_improved(sap_model, target_load_cases: List[str]) -> No
             drift_rad = drift_val[i]
             drift_permil = drift_rad * 1000.0
 
-            direction_raw = dir_val[i].strip().upper()
-            direction_key = None
-            if direction_raw in ["X", "UX", "U1"]:
-                direction_key = "X"
-            elif direction_raw in ["Y", "UY", "U2"]:
-                direction_key = "Y"
+            direction_key = _DRIFT_DIRECTION_KEYS.get(dir_val[i].strip().upper())
 
-            if direction_key and direction_key in max_drift_per_direction:
+            if direction_key:
                 if abs(drift_permil) > abs(max_drift_per_direction[direction_key]):
                     max_drift_per_direction[direction_key] = abs(drift_permil)
                     max_drift_info[direction_key] = {
@@ -8,11 +8,9 @@
 import os
 import csv
 import traceback
-import sys
 from datetime import datetime
 from common.config import *  # noqa: F401,F403
 from common.etabs_setup import get_sap_model, ensure_etabs_ready
-from common.utility_functions import check_ret, arr
 
 
 def extract_all_concrete_design_data(column_names, beam_names):
@@ -523,8 +521,10 @@ def extract_table_using_array_method(sap_model, table_key, output_file, componen
                 unique_name_index = find_component_name_column(field_keys_list)
 
                 if unique_name_index is not None:
+                    # 集合成员判断为 O(1)，避免每行线性扫描名称列表
+                    component_name_set = frozenset(component_names)
                     for row in data_rows:
-                        if len(row) > unique_name_index and row[unique_name_index] in component_names:
+                        if len(row) > unique_name_index and row[unique_name_index] in component_name_set:
                             writer.writerow(row)
                             written_count += 1
                 else:
@@ -575,11 +575,12 @@ def filter_csv_by_components(input_file, output_file, component_names):
 
                 written_count = 0
                 total_count = 0
+                component_name_set = frozenset(component_names)
 
                 for row in reader:
                     total_count += 1
                     if name_col_index is not None and len(row) > name_col_index:
-                        if row[name_col_index] in component_names:
+                        if row[name_col_index] in component_name_set:
                             writer.writerow(row)
                             written_count += 1
                     elif name_col_index is None:
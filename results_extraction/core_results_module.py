@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Dict, Union
 
 from results_extraction.analysis_results_module import extract_modal_and_drift
-from common.config import SCRIPT_DIRECTORY
+from common.config import script_directory_path
 from .design_forces import check_design_completion, extract_design_forces_simple
 
 CORE_RESULT_BASENAMES = {
@@ -24,8 +24,7 @@ _RESULT_EXTS = {".csv", ".xls", ".xlsx", ".txt"}
 
 
 def _cleanup_extra_result_files(output_dir: Path, keep_names: set[str]) -> None:
-    """Delete non-core result files in the output directory (csv/xls/xlsx/txt only)."""
-    output_dir.mkdir(parents=True, exist_ok=True)
+    """Delete non-core result files in the output directory (csv/xls/xlsx/txt only; output_dir must exist)."""
     for p in output_dir.iterdir():
         if not p.is_file():
             continue
@@ -43,14 +42,16 @@ def _cleanup_extra_result_files(output_dir: Path, keep_names: set[str]) -> None:
 def _ensure_output_path(filename: str, output_dir: Path) -> Path:
     """
     Move an exported design file from SCRIPT_DIRECTORY into the target output
-    directory and return the destination path.
+    directory and return the destination path. output_dir must already exist.
     """
-    src = Path(SCRIPT_DIRECTORY) / filename
     dest = output_dir / filename
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    # SCRIPT_DIRECTORY is read on every call so a later change to it is honoured
+    script_dir = script_directory_path()
+    # Exports already land in the output directory: nothing to move
+    if output_dir.resolve() == script_dir.resolve():
+        return dest
+    src = script_dir / filename
     if src.exists():
-        if dest.exists() and dest.resolve() == src.resolve():
-            return dest
         try:
             shutil.move(str(src), dest)
         except Exception:
@@ -90,6 +91,7 @@ def export_core_results(sap_model, output_dir: Union[str, Path]) -> Dict[str, Pa
     Export core analysis/design result files and return a mapping of name to path.
     Five key outputs are always included.
     """
+    # The output directory is created once here; the helpers below assume it exists
     output_directory = Path(output_dir)
     output_directory.mkdir(parents=True, exist_ok=True)
 
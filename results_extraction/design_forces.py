@@ -27,7 +27,7 @@ from datetime import datetime
 
 from common.config import *
 from common.etabs_setup import get_sap_model, ensure_etabs_ready
-from common.utility_functions import check_ret, arr
+from common.utility_functions import _empty_arrays
 
 
 # =============================================================================
@@ -371,6 +371,8 @@ def extract_design_forces_simple(sap_model, table_key, component_names, output_f
         db = sap_model.DatabaseTables
 
         filter_by_names = component_names is not None and len(component_names) > 0
+        # 按行过滤时用集合做 O(1) 成员判断，避免每行线性扫描名称列表
+        component_name_set = frozenset(component_names) if filter_by_names else frozenset()
         if not filter_by_names:
             print("ℹ️ 当前不按构件名称过滤，将导出整张表。")
 
@@ -456,7 +458,7 @@ def extract_design_forces_simple(sap_model, table_key, component_names, output_f
 
                         # 过滤：按构件名称匹配
                         if name_col_index is not None and len(row) > name_col_index:
-                            if row[name_col_index] in component_names:
+                            if row[name_col_index] in component_name_set:
                                 writer.writerow(row)
                                 written_count += 1
                         elif name_col_index is None:
@@ -734,24 +736,18 @@ def extract_column_pmm_design_forces(sap_model, column_names):
             ]
             all_rows = []
 
+            # 输出参数占位数组使用进程内共享的零长度数组：ETABS 每次调用都会返回新分配的结果数组
+            NumberItems = System.Int32(0)
+            empty_str, empty_dbl, MyOption = _empty_arrays()
+            FrameName = PMMCombo = VmajorCombo = VminorCombo = ErrorSummary = WarningSummary = empty_str
+            Location = PMMArea = PMMRatio = AVmajor = AVminor = empty_dbl
+            item_type_objects = ETABSv1.eItemType.Objects
+            get_summary_results_column = dc.GetSummaryResultsColumn
+
             for frame_name, label, story in column_frame_infos:
                 try:
-                    NumberItems = System.Int32(0)
-                    FrameName = System.Array.CreateInstance(System.String, 0)
-                    MyOption = System.Array.CreateInstance(System.Int32, 0)
-                    Location = System.Array.CreateInstance(System.Double, 0)
-                    PMMCombo = System.Array.CreateInstance(System.String, 0)
-                    PMMArea = System.Array.CreateInstance(System.Double, 0)
-                    PMMRatio = System.Array.CreateInstance(System.Double, 0)
-                    VmajorCombo = System.Array.CreateInstance(System.String, 0)
-                    AVmajor = System.Array.CreateInstance(System.Double, 0)
-                    VminorCombo = System.Array.CreateInstance(System.String, 0)
-                    AVminor = System.Array.CreateInstance(System.Double, 0)
-                    ErrorSummary = System.Array.CreateInstance(System.String, 0)
-                    WarningSummary = System.Array.CreateInstance(System.String, 0)
-
                     # 显式指定 ItemType = Objects
-                    ret2 = dc.GetSummaryResultsColumn(
+                    ret2 = get_summary_results_column(
                         frame_name,
                         NumberItems,
                         FrameName,
@@ -766,7 +762,7 @@ def extract_column_pmm_design_forces(sap_model, column_names):
                         AVminor,
                         ErrorSummary,
                         WarningSummary,
-                        ETABSv1.eItemType.Objects,
+                        item_type_objects,
                     )
 
                     if isinstance(ret2, tuple):
@@ -1038,10 +1034,11 @@ def extract_beam_design_forces(sap_model, beam_names):
                         writer.writerow(row)
                     written_count = len(data_rows)
                 else:
+                    beam_name_set = frozenset(beam_names)
                     for row in data_rows:
                         if (
                             len(row) > unique_name_index
-                            and row[unique_name_index] in beam_names
+                            and row[unique_name_index] in beam_name_set
                         ):
                             writer.writerow(row)
                             written_count += 1
@@ -7,17 +7,27 @@ Design result extraction utilities (migrated from design_module).
 from __future__ import annotations
 
 import os
+import io
+import logging
 import csv
+import codecs
 import time
-import traceback
-from typing import Any, Dict, List
+from collections import namedtuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
+from common.config import DEBUG_TRACEBACK
 from common.etabs_setup import get_etabs_objects
-from common.utility_functions import check_ret
 from common.etabs_api_loader import get_api_objects
+from common.utility_functions import _empty_arrays, _get_marshal
 
 ETABSv1, System, COMException = get_api_objects()
 
+# Per-frame progress goes through logging (lazy %-formatting, silenced below INFO);
+# stage banners and totals stay on print like the rest of the workflow
+log = logging.getLogger(__name__)
+
 
 def _ensure_api_objects():
     """Lazy-refresh ETABS API objects to avoid None during design extraction."""
@@ -26,30 +36,180 @@ def _ensure_api_objects():
         ETABSv1, System, COMException = get_api_objects()
     return ETABSv1, System, COMException
 
+# Output file names shared by the savers and the summary report
+ENHANCED_RESULTS_FILENAME = "concrete_design_results_enhanced.csv"
+BEAM_RESULTS_FILENAME = "beam_design_results_final.csv"
+COLUMN_RESULTS_FILENAME = "column_design_results_final.csv"
+
+# Preferred column order for the enhanced CSV; unknown keys are appended sorted
+_ENHANCED_FIELD_ORDER = (
+    'Frame_Name', 'Element_Type', 'Source',
+    # beam fields
+    'Top_As_mm2', 'Bot_As_mm2', 'V_Major_As_mm2_per_m',
+    'Top_As_cm2', 'Bot_As_cm2',
+    'Top_Validation', 'Bot_Validation',
+    # column fields
+    'Total_As_mm2', 'Total_As_cm2', 'PMM_Ratio', 'PMM_Combo',
+    'Area_Validation', 'Validation_Warnings', 'Validation_Suggestions',
+    # diagnostics
+    'Num_Results', 'Raw_PMM_Count', 'Error_Code',
+    'Parse_Error', 'Warning', 'Error', 'Warnings',
+)
+_ENHANCED_FIELD_SET = frozenset(_ENHANCED_FIELD_ORDER)
+
+# Narrow projection of an enhanced result dict holding only what the validation summary reads
+_ValidationRecord = namedtuple(
+    "_ValidationRecord", ("element_type", "area_validation", "top_validation", "bot_validation"))
+
+# Substrings used by the enhanced extractor to recognise beams/columns by name
+_BEAM_NAME_KEYWORDS = ('BEAM', 'B_', 'B-')
+_COLUMN_NAME_KEYWORDS = ('COL_', 'COL-', 'C_', 'C-', 'COLUMN')
+
+# Column headers for the original-format beam/column CSVs
+_BEAM_RESULT_HEADER = ("Frame_Name", "Src", "Top_Rebar_m2", "Bot_Rebar_m2")
+_COLUMN_RESULT_HEADER = ("Frame_Name", "Src", "Long_Rebar_m2")
+
+# Fixed-schema summary report; only the paths are filled in per run
+_SUMMARY_REPORT_TEMPLATE = (
+    "Design Result Summary\n"
+    "---------------------\n"
+    "Beam results: {beam_path}\n"
+    "Column results: {column_path}\n"
+    "Enhanced combined results: {enhanced_path}\n"
+)
+
+_CSV_BUFFER_SIZE = 1 << 20
+
+
+def _progress_step(total: int, minimum: int = 50) -> int:
+    """Progress log interval: roughly 1% of the loop, never more often than every `minimum` items."""
+    return max(minimum, total // 100)
+
+
+def _open_csv_for_excel(filepath: str):
+    """Open a CSV for writing: UTF-8 BOM written once (Excel), then plain utf-8 with a 1 MiB buffer."""
+    raw = open(filepath, "wb", buffering=_CSV_BUFFER_SIZE)
+    raw.write(codecs.BOM_UTF8)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def _write_csv(filepath: str, header, rows) -> None:
+    """Format all rows in memory with csv.writer (keeps quoting), then emit them in a single write()."""
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(header)
+    writer.writerows(rows)
+    with _open_csv_for_excel(filepath) as f:
+        f.write(buf.getvalue())
+
 # ====================  ====================
 
 def convert_system_array_to_python_list(system_array):
     """Convert System.Array (or Python iterable) to a Python list safely."""
-    _ensure_api_objects()
     if system_array is None:
         return []
 
     try:
-        # System.Array?
-        if hasattr(system_array, 'Length'):
-            result = []
-            for i in range(system_array.Length):
-                result.append(system_array[i])
-            return result
-        elif hasattr(system_array, '__len__'):
+        # System.Array / sequences: marshal in one pass via the iterator protocol
+        # instead of indexing element-by-element across the CLR boundary.
+        if hasattr(system_array, 'Length') or hasattr(system_array, '__len__'):
             return list(system_array)
-        else:
-            return [system_array] if system_array is not None else []
+        return [system_array]
     except Exception as e:
         print(f"     System.Array: {e}")
         return []
 
 
+def _beam_summary_out_args():
+    """Out-parameters for DesignConcrete.GetSummaryResultsBeam (NumberItems .. WarningSummary)."""
+    s, d, _ = _empty_arrays()
+    # FrameName, Location, TopCombo, TopArea, BotCombo, BotArea, VMajorCombo, VMajorArea,
+    # TLCombo, TLArea, TTCombo, TTArea, ErrorSummary, WarningSummary
+    return (0, s, d, s, d, s, d, s, d, s, d, s, d, s, s)
+
+
+def _column_summary_out_args():
+    """Out-parameters for DesignConcrete.GetSummaryResultsColumn (NumberItems .. WarningSummary)."""
+    s, d, i = _empty_arrays()
+    # FrameName, MyOption, Location, PMMCombo, PMMArea, PMMRatio, VMajorCombo, AVMajor,
+    # VMinorCombo, AVMinor, ErrorSummary, WarningSummary
+    return (0, s, i, d, s, d, d, s, d, s, d, s, s)
+
+
+def _fetch_summaries(get_summary, names: List[str], out_args) -> Iterable[Any]:
+    """
+    Call get_summary(name, *out_args) for every name, in order.
+
+    Each entry is the API return tuple or the exception it raised. The
+    result is lazy, so each tuple of .NET result arrays can be dropped as
+    soon as the caller has reduced it.
+    """
+    def call(name):
+        try:
+            return get_summary(name, *out_args)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    return map(call, names)
+
+
+def get_all_frame_names(sap_model) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """
+    Return (all_names, beam_names, column_names) from a single GetNameList call.
+
+    Names are materialized and classified by BEAM/COL prefix in one pass; callers
+    that need the lists more than once should pass them along instead of re-querying.
+    Returns None if ETABS reports an error.
+    """
+    ret, _, names = sap_model.FrameObj.GetNameList(0, _empty_arrays()[0])
+    if ret != 0:
+        return None
+
+    all_names = [str(name) for name in names]
+    beam_names, column_names = [], []
+    for name in all_names:
+        upper = name.upper()
+        if upper.startswith("BEAM"):
+            beam_names.append(name)
+        elif upper.startswith("COL"):
+            column_names.append(name)
+
+    return all_names, beam_names, column_names
+
+
+def get_beam_and_column_names(sap_model) -> Optional[Tuple[List[str], List[str]]]:
+    """Return (beam_names, column_names) from one GetNameList call, or None on an ETABS error."""
+    frame_name_lists = get_all_frame_names(sap_model)
+    if frame_name_lists is None:
+        return None
+    return frame_name_lists[1], frame_name_lists[2]
+
+
+def _to_np(values) -> np.ndarray:
+    """
+    Copy a System.Array[Double] (or sequence) into a float64 array.
+
+    .NET double arrays are block-copied with Marshal.Copy into the ndarray's
+    buffer (one interop call); anything else goes through np.fromiter.
+    """
+    marshal = _get_marshal()
+    if marshal and System is not None and isinstance(values, System.Array[System.Double]):
+        n = values.Length
+        buf = np.empty(n, dtype=np.float64)
+        if n:
+            marshal.Copy(values, 0, System.IntPtr(buf.ctypes.data), n)
+        return buf
+    return np.fromiter(values, dtype=np.float64, count=len(values))
+
+
+def _positive_max(values) -> float:
+    """Largest positive entry of a System.Array[Double] (or sequence), 0.0 if there is none."""
+    if values is None:
+        return 0.0
+    arr = _to_np(values)
+    return float(arr.max(initial=0.0, where=arr > 0))
+
+
 def convert_area_units(area_in_m2: float) -> float:
     """Convert area from m^2 to mm^2 (with legacy correction factor)."""
     if area_in_m2 is None or area_in_m2 == 0:
@@ -103,8 +263,15 @@ def validate_reinforcement_area(area_mm2: float, element_type: str = "column") -
         validation_result["warnings"].append(f"Unknown element type: {element_type}")
 
     return validation_result
+
+
+# Whether DesignConcrete.GetSummaryResultsBeam_2 is usable; resolved on the first beam, not per call
+_beam_summary_2_supported: Optional[bool] = None
+
+
 def _get_beam_design_summary_enhanced(design_concrete, beam_name: str) -> Dict[str, Any]:
     """Enhanced beam design summary using ETABS API."""
+    global _beam_summary_2_supported
     try:
         # ?
         error_code, number_results = 1, 0
@@ -112,7 +279,9 @@ def _get_beam_design_summary_enhanced(design_concrete, beam_name: str) -> Dict[s
         source = "API-"
 
         # PI
-        if hasattr(design_concrete, 'GetSummaryResultsBeam_2'):
+        if _beam_summary_2_supported is None:
+            _beam_summary_2_supported = hasattr(design_concrete, 'GetSummaryResultsBeam_2')
+        if _beam_summary_2_supported:
             try:
                 #  GetSummaryResultsBeam_2 (26 parameters)
                 # We pass placeholders for the 'ref' parameters
@@ -130,15 +299,13 @@ def _get_beam_design_summary_enhanced(design_concrete, beam_name: str) -> Dict[s
                 else:
                     return {"Source": "API-2-", "Error": f": {type(result)}, : {len(result)}"}
             except Exception as e_2:
-                # If GetSummaryResultsBeam_2 fails, log it and fallback
+                # If GetSummaryResultsBeam_2 fails, log it once and use the original API for the remaining beams
                 print(f"     GetSummaryResultsBeam_2  ({beam_name}): {e_2}, API...")
-                pass  # Fallback will be attempted below
+                _beam_summary_2_supported = False
 
         # APIPI
         if source != "API-2-":
-            result = design_concrete.GetSummaryResultsBeam(
-                beam_name, 0, [], [], [], [], [], [], [], [], [], [], [], [], [], []
-            )
+            result = design_concrete.GetSummaryResultsBeam(beam_name, *_beam_summary_out_args())
 
             if not isinstance(result, tuple) or len(result) != 16:
                 return {"Source": "API-1-", "Error": f": {type(result)}, : {len(result)}"}
@@ -158,20 +325,16 @@ def _get_beam_design_summary_enhanced(design_concrete, beam_name: str) -> Dict[s
 
         # System.Arrayython?
         try:
-            top_areas_list = convert_system_array_to_python_list(top_areas)
-            bot_areas_list = convert_system_array_to_python_list(bot_areas)
-            vmajor_areas_list = convert_system_array_to_python_list(vmajor_areas)
-
-            # ?
-            top_areas_mm2 = [convert_area_units(float(x)) for x in top_areas_list if x is not None and x > 0]
-            bot_areas_mm2 = [convert_area_units(float(x)) for x in bot_areas_list if x is not None and x > 0]
-            # ?
-            vmajor_areas_mm2_per_m = [convert_shear_area_units(float(x)) for x in vmajor_areas_list if
-                                      x is not None and x > 0]
-
-            max_top = max(top_areas_mm2) if top_areas_mm2 else 0.0
-            max_bot = max(bot_areas_mm2) if bot_areas_mm2 else 0.0
-            max_vmajor = max(vmajor_areas_mm2_per_m) if vmajor_areas_mm2_per_m else 0.0
+            # Single-pass positive max per array; the unit conversion is linear, so convert once after max
+            max_top = convert_area_units(max(
+                (float(x) for x in convert_system_array_to_python_list(top_areas) if x is not None and x > 0),
+                default=0.0))
+            max_bot = convert_area_units(max(
+                (float(x) for x in convert_system_array_to_python_list(bot_areas) if x is not None and x > 0),
+                default=0.0))
+            max_vmajor = convert_shear_area_units(max(
+                (float(x) for x in convert_system_array_to_python_list(vmajor_areas) if x is not None and x > 0),
+                default=0.0))
 
             # ?
             top_validation = validate_reinforcement_area(max_top, "unknown")
@@ -275,9 +438,9 @@ def _get_column_design_summary_enhanced(design_concrete, col_name: str) -> Dict[
 
             if pmm_areas is not None:
                 pmm_areas_list = convert_system_array_to_python_list(pmm_areas)
-                # ?
-                pmm_areas_mm2 = [convert_area_units(float(x)) for x in pmm_areas_list if x is not None and x != 0]
-                max_area = max(pmm_areas_mm2) if pmm_areas_mm2 else 0.0
+                # single pass; convert_area_units is linear, so convert the max once
+                max_area = convert_area_units(max(
+                    (float(x) for x in pmm_areas_list if x is not None and x != 0), default=0.0))
             else:
                 max_area = 0.0
                 pmm_areas_list = []
@@ -331,38 +494,27 @@ def _get_column_design_summary_enhanced(design_concrete, col_name: str) -> Dict[
 
 def extract_design_results_enhanced() -> List[Dict[str, Any]]:
     """Enhanced beam/column design extraction with basic validation and summaries."""
-    _ensure_api_objects()
-    _ensure_api_objects()
     _, sap_model = get_etabs_objects()
     print("\n--- Enhanced design extraction ---")
 
     try:
-        print("   Preparing story and frame lists...")
-
-        NumberStories, StoryNamesArr = 0, System.Array.CreateInstance(System.String, 0)
-        ret, number_stories, story_names_tuple = sap_model.Story.GetNameList(NumberStories, StoryNamesArr)
-        story_names = list(story_names_tuple)
-        check_ret(ret, "Story.GetNameList")
-
-        print(f"  Stories detected: {number_stories}")
-
-        all_frame_names = []
-        for story in story_names:
-            NumberItemsOnStory, StoryFrameNamesArr = 0, System.Array.CreateInstance(System.String, 0)
-            ret, count, story_frames_tuple = sap_model.FrameObj.GetNameListOnStory(story, NumberItemsOnStory,
-                                                                                   StoryFrameNamesArr)
-            if ret == 0 and count > 0:
-                all_frame_names.extend(list(story_frames_tuple))
+        print("   Preparing frame list...")
 
-        frame_names = sorted(list(set(all_frame_names)))
+        # One FrameObj.GetNameList call replaces the per-story GetNameListOnStory sweep
+        frame_name_lists = get_all_frame_names(sap_model)
+        frame_names = sorted(set(frame_name_lists[0])) if frame_name_lists is not None else []
         if not frame_names:
             print("No frame names found; skipping design results extraction.")
             return []
 
-        # simple name heuristics
-        beam_names = [n for n in frame_names if any(kw in n.upper() for kw in ['BEAM', 'B_', 'B-'])]
-        column_names = [n for n in frame_names if
-                        any(kw in n.upper() for kw in ['COL_', 'COL-', 'C_', 'C-', 'COLUMN'])]
+        # simple name heuristics; upper-case each name once for both checks
+        beam_names, column_names = [], []
+        for n in frame_names:
+            upper = n.upper()
+            if any(kw in upper for kw in _BEAM_NAME_KEYWORDS):
+                beam_names.append(n)
+            if any(kw in upper for kw in _COLUMN_NAME_KEYWORDS):
+                column_names.append(n)
 
         print(f"  Frames detected: beams={len(beam_names)}, columns={len(column_names)}")
 
@@ -374,9 +526,10 @@ def extract_design_results_enhanced() -> List[Dict[str, Any]]:
         beam_no_data_count = 0
         beam_warning_count = 0
 
+        beam_step = _progress_step(len(beam_names))
         for i, name in enumerate(beam_names):
-            if (i + 1) % 50 == 0 or i == len(beam_names) - 1:
-                print(f"    Beam progress: {i + 1}/{len(beam_names)}")
+            if (i + 1) % beam_step == 0 or i == len(beam_names) - 1:
+                log.info("    Beam progress: %d/%d", i + 1, len(beam_names))
 
             result = _get_beam_design_summary_enhanced(design_concrete, name)
             if "" in result.get("Source", ""):
@@ -397,11 +550,12 @@ def extract_design_results_enhanced() -> List[Dict[str, Any]]:
         col_no_data_count = 0
         col_validation_warning_count = 0
 
+        column_step = _progress_step(len(column_names), minimum=30)
         for i, name in enumerate(column_names):
-            if (i + 1) % 30 == 0 or i == len(column_names) - 1:
-                print(
-                    f"    Column progress ({i + 1}/{len(column_names)}) - success: {col_success_count}, partial: {col_partial_count}, warnings: {col_validation_warning_count}"
-                )
+            if (i + 1) % column_step == 0 or i == len(column_names) - 1:
+                log.info("    Column progress (%d/%d) - success: %d, partial: %d, warnings: %d",
+                         i + 1, len(column_names), col_success_count, col_partial_count,
+                         col_validation_warning_count)
 
             result = _get_column_design_summary_enhanced(design_concrete, name)
             if result.get("Source") == "API-":
@@ -442,44 +596,30 @@ def extract_design_results_enhanced() -> List[Dict[str, Any]]:
 
     except Exception as e:
         print(f"Warning: failed to extract design results: {e}")
-        traceback.print_exc()
+        if DEBUG_TRACEBACK:
+            import traceback  # only needed for debug output
+            traceback.print_exc()
         return []
 
 
 def save_design_results_enhanced(design_data: List[Dict[str, Any]], output_dir: str):
-    """CSV"""
+    """Write the combined beam/column design results to CSV."""
     if not design_data:
-        print(" ")
+        print("No design data to save; skipping enhanced CSV.")
         return
 
-    filepath = os.path.join(output_dir, "concrete_design_results_enhanced.csv")
-    print(f"\n : {filepath}")
+    filepath = os.path.join(output_dir, ENHANCED_RESULTS_FILENAME)
+    print(f"\nSaving enhanced design results to: {filepath}")
 
     try:
         all_keys = set().union(*(d.keys() for d in design_data))
 
-        # ?
-        fieldnames = [
-            'Frame_Name', 'Element_Type', 'Source',
-            # ?
-            'Top_As_mm2', 'Bot_As_mm2', 'V_Major_As_mm2_per_m',
-            'Top_As_cm2', 'Bot_As_cm2',
-            'Top_Validation', 'Bot_Validation',
-            # ?
-            'Total_As_mm2', 'Total_As_cm2', 'PMM_Ratio', 'PMM_Combo',
-            'Area_Validation', 'Validation_Warnings', 'Validation_Suggestions',
-            # ?
-            'Num_Results', 'Raw_PMM_Count', 'Error_Code',
-            'Parse_Error', 'Warning', 'Error', 'Warnings'
-        ]
-
-        final_fieldnames = [k for k in fieldnames if k in all_keys] + sorted(
-            [k for k in all_keys if k not in fieldnames])
+        final_fieldnames = [k for k in _ENHANCED_FIELD_ORDER if k in all_keys] + sorted(
+            k for k in all_keys if k not in _ENHANCED_FIELD_SET)
 
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=final_fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(design_data)
+        # Positional rows; missing keys become "" as DictWriter's restval did
+        _write_csv(filepath, final_fieldnames,
+                   (tuple(d.get(k, "") for k in final_fieldnames) for d in design_data))
 
         print(f"Total design records: {len(design_data)}")
 
@@ -496,8 +636,18 @@ def print_enhanced_validation_statistics(design_data: List[Dict[str, Any]], outp
         print("No design data to summarize.")
         return
 
-    successful_columns = [r for r in design_data if r.get("Element_Type") == "column" and "API-" in r.get("Source", "")]
-    successful_beams = [r for r in design_data if r.get("Element_Type") == "beam" and "API-" in r.get("Source", "")]
+    # Single pass over design_data: project each successful row into a compact record once,
+    # so the counting passes below use attribute access instead of repeated dict lookups
+    successful_columns, successful_beams = [], []
+    for r in design_data:
+        if "API-" not in r.get("Source", ""):
+            continue
+        record = _ValidationRecord(r.get("Element_Type"), r.get("Area_Validation"),
+                                   r.get("Top_Validation"), r.get("Bot_Validation"))
+        if record.element_type == "column":
+            successful_columns.append(record)
+        elif record.element_type == "beam":
+            successful_beams.append(record)
 
     stats_lines = [
         "=== Validation Summary ===",
@@ -510,30 +660,28 @@ def print_enhanced_validation_statistics(design_data: List[Dict[str, Any]], outp
     ]
 
     if successful_columns:
-        reasonable_count = sum(1 for r in successful_columns if r.get("Area_Validation") == "")
-        stats_lines.append("")
-        stats_lines.append("Column area validation:")
-        stats_lines.append(
-            f"  OK: {reasonable_count}/{len(successful_columns)} ({reasonable_count / len(successful_columns) * 100:.1f}%)"
-        )
-        stats_lines.append(
+        reasonable_count = sum(1 for r in successful_columns if r.area_validation == "")
+        stats_lines.extend((
+            "",
+            "Column area validation:",
+            f"  OK: {reasonable_count}/{len(successful_columns)} ({reasonable_count / len(successful_columns) * 100:.1f}%)",
             f"  Needs review: {len(successful_columns) - reasonable_count}/{len(successful_columns)} "
-            f"({(len(successful_columns) - reasonable_count) / len(successful_columns) * 100:.1f}%)"
-        )
+            f"({(len(successful_columns) - reasonable_count) / len(successful_columns) * 100:.1f}%)",
+        ))
 
     if successful_beams:
-        beam_reasonable_top = sum(1 for r in successful_beams if r.get("Top_Validation") == "")
-        beam_reasonable_bot = sum(1 for r in successful_beams if r.get("Bot_Validation") == "")
-        stats_lines.append("")
-        stats_lines.append("Beam validation:")
-        stats_lines.append(
-            f"  OK (top): {beam_reasonable_top}/{len(successful_beams)} ({beam_reasonable_top / len(successful_beams) * 100:.1f}%)"
-        )
-        stats_lines.append(
-            f"  OK (bottom): {beam_reasonable_bot}/{len(successful_beams)} ({beam_reasonable_bot / len(successful_beams) * 100:.1f}%)"
-        )
-
-    stats_text = "`n".join(stats_lines) + "`n"
+        beam_reasonable_top = sum(1 for r in successful_beams if r.top_validation == "")
+        beam_reasonable_bot = sum(1 for r in successful_beams if r.bot_validation == "")
+        stats_lines.extend((
+            "",
+            "Beam validation:",
+            f"  OK (top): {beam_reasonable_top}/{len(successful_beams)} ({beam_reasonable_top / len(successful_beams) * 100:.1f}%)",
+            f"  OK (bottom): {beam_reasonable_bot}/{len(successful_beams)} ({beam_reasonable_bot / len(successful_beams) * 100:.1f}%)",
+        ))
+
+    # Collect chunks and join once; also fixes the stray PowerShell "`n" separator
+    stats_lines.append("")
+    stats_text = "\n".join(stats_lines)
     print(stats_text)
 
     stats_file = os.path.join(output_dir, "validation_statistics_enhanced.txt")
@@ -546,28 +694,31 @@ def print_enhanced_validation_statistics(design_data: List[Dict[str, Any]], outp
 def generate_enhanced_summary_report(output_dir: str):
     """Write a lightweight design summary report pointing to key outputs."""
     os.makedirs(output_dir, exist_ok=True)
-    beam_path = os.path.join(output_dir, "beam_design_results_final.csv")
-    column_path = os.path.join(output_dir, "column_design_results_final.csv")
-    enhanced_path = os.path.join(output_dir, "concrete_design_results_enhanced.csv")
+    beam_path = os.path.join(output_dir, BEAM_RESULTS_FILENAME)
+    column_path = os.path.join(output_dir, COLUMN_RESULTS_FILENAME)
+    enhanced_path = os.path.join(output_dir, ENHANCED_RESULTS_FILENAME)
     report_path = os.path.join(output_dir, "design_summary_report.txt")
 
-    lines = [
-        "Design Result Summary",
-        "---------------------",
-        f"Beam results: {beam_path}",
-        f"Column results: {column_path}",
-        f"Enhanced combined results: {enhanced_path}",
-    ]
+    report = _SUMMARY_REPORT_TEMPLATE.format(
+        beam_path=beam_path,
+        column_path=column_path,
+        enhanced_path=enhanced_path,
+    )
 
     try:
         with open(report_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+            f.write(report)
         print(f"Summary report written to {report_path}")
     except Exception as e:
         print(f"Failed to write summary report: {e}")
-def extract_and_save_beam_results(output_dir: str) -> None:
+def extract_and_save_beam_results(output_dir: str, filepath: Optional[str] = None,
+                                   beam_names: Optional[List[str]] = None) -> None:
     """
-    ?
+    Extract and save beam design summaries (original format).
+
+    Pass filepath to override the default CSV location.
+    beam_names lets the caller pass an already classified list; by default it is
+    taken from get_all_frame_names.
     """
     _ensure_api_objects()
     _, sap_model = get_etabs_objects()
@@ -577,55 +728,50 @@ def extract_and_save_beam_results(output_dir: str) -> None:
     try:
         dc = sap_model.DesignConcrete
 
-        number_names = 0
-        frame_names_tuple = System.Array.CreateInstance(System.String, 0)
-        ret, number_names, frame_names_tuple = sap_model.FrameObj.GetNameList(number_names, frame_names_tuple)
-        if ret != 0:
-            print("  Failed to get frame name list.")
-            return
-
-        frame_names = list(frame_names_tuple)
-        beam_names = [name for name in frame_names if name.upper().startswith("BEAM")]
+        if beam_names is None:
+            frame_name_lists = get_all_frame_names(sap_model)
+            if frame_name_lists is None:
+                print("  Failed to get frame name list.")
+                return
+            beam_names = frame_name_lists[1]
 
         if not beam_names:
             print("  No beams found.")
             return
 
         print(f"   {len(beam_names)} beams to process...")
-        all_results = []
+        # Text columns per beam plus one float64 block (top, bottom) formatted in bulk on write
+        sources = [None] * len(beam_names)
+        areas = np.zeros((len(beam_names), 2), dtype=np.float64)
+        ok = np.zeros(len(beam_names), dtype=bool)
         valid_results = 0
 
-        for i, name in enumerate(beam_names):
-            if (i + 1) % 50 == 0:
-                print(f"    Progress: {i + 1}/{len(beam_names)}")
-
-            result = {"Frame_Name": name}
-            try:
-                res = dc.GetSummaryResultsBeam(name, 0, [], [], [], [], [], [], [], [], [], [], [], [], [], [])
-                ret_code, num_items, _, _, _, top_areas, _, bot_areas, *_ = res
-
-                if ret_code == 0 and num_items > 0:
-                    top_areas_list = [a for a in convert_system_array_to_python_list(top_areas) if a > 0]
-                    bot_areas_list = [a for a in convert_system_array_to_python_list(bot_areas) if a > 0]
-
-                    max_top = max(top_areas_list) if top_areas_list else 0
-                    max_bot = max(bot_areas_list) if bot_areas_list else 0
+        summaries = _fetch_summaries(dc.GetSummaryResultsBeam, beam_names, _beam_summary_out_args())
 
-                    result.update({"Src": "OK", "Top_Rebar_m2": f"{max_top:.6f}", "Bot_Rebar_m2": f"{max_bot:.6f}"})
-                    valid_results += 1
-                else:
-                    result.update({"Src": "No Results", "Top_Rebar_m2": 0, "Bot_Rebar_m2": 0})
+        progress_step = _progress_step(len(beam_names))
+        for i, (name, res) in enumerate(zip(beam_names, summaries)):
+            if (i + 1) % progress_step == 0:
+                log.info("    Progress: %d/%d", i + 1, len(beam_names))
 
-            except Exception as exc:  # noqa: BLE001
-                result.update({"Src": f"Error: {str(exc)[:40]}", "Top_Rebar_m2": 0, "Bot_Rebar_m2": 0})
+            if isinstance(res, Exception):
+                sources[i] = f"Error: {str(res)[:40]}"
+                continue
 
-            all_results.append(result)
+            # (ret, NumberItems, FrameName, Location, TopCombo, TopArea, BotCombo, BotArea, ...)
+            if res[0] == 0 and res[1] > 0:
+                areas[i, 0] = _positive_max(res[5])
+                areas[i, 1] = _positive_max(res[7])
+                ok[i] = True
+                sources[i] = "OK"
+                valid_results += 1
+            else:
+                sources[i] = "No Results"
 
-        filepath = os.path.join(output_dir, "beam_design_results_final.csv")
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=all_results[0].keys())
-            writer.writeheader()
-            writer.writerows(all_results)
+        if filepath is None:
+            filepath = os.path.join(output_dir, BEAM_RESULTS_FILENAME)
+        formatted = np.char.mod("%.6f", areas)
+        formatted[~ok] = "0"  # rows without results keep the plain "0" of the original format
+        _write_csv(filepath, _BEAM_RESULT_HEADER, zip(beam_names, sources, formatted[:, 0], formatted[:, 1]))
 
         print(f"Beam results saved to {filepath}")
         print(f"   Completed: {valid_results}/{len(beam_names)}")
@@ -634,8 +780,15 @@ def extract_and_save_beam_results(output_dir: str) -> None:
         print(f"Failed to save beam results: {exc}")
 
 
-def extract_and_save_column_results(output_dir: str) -> None:
-    """Extract and save column design summaries (original format)."""
+def extract_and_save_column_results(output_dir: str, filepath: Optional[str] = None,
+                                     column_names: Optional[List[str]] = None) -> None:
+    """
+    Extract and save column design summaries (original format).
+
+    Pass filepath to override the default CSV location.
+    column_names lets the caller pass an already classified list; by default it is
+    taken from get_all_frame_names.
+    """
     _, sap_model = get_etabs_objects()
     print("\n--- Column design results ---")
     os.makedirs(output_dir, exist_ok=True)
@@ -643,51 +796,49 @@ def extract_and_save_column_results(output_dir: str) -> None:
     try:
         dc = sap_model.DesignConcrete
 
-        number_names = 0
-        frame_names_tuple = System.Array.CreateInstance(System.String, 0)
-        ret, number_names, frame_names_tuple = sap_model.FrameObj.GetNameList(number_names, frame_names_tuple)
-        if ret != 0:
-            print("  Failed to get frame name list.")
-            return
-
-        frame_names = list(frame_names_tuple)
-        column_names = [name for name in frame_names if name.upper().startswith("COL")]
+        if column_names is None:
+            frame_name_lists = get_all_frame_names(sap_model)
+            if frame_name_lists is None:
+                print("  Failed to get frame name list.")
+                return
+            column_names = frame_name_lists[2]
 
         if not column_names:
             print("  No columns found.")
             return
 
         print(f"   {len(column_names)} columns to process...")
-        all_results = []
+        # Text columns per column plus a float64 area vector formatted in bulk on write
+        sources = [None] * len(column_names)
+        areas = np.zeros(len(column_names), dtype=np.float64)
+        ok = np.zeros(len(column_names), dtype=bool)
         valid_results = 0
 
-        for i, name in enumerate(column_names):
-            if (i + 1) % 50 == 0:
-                print(f"    Progress: {i + 1}/{len(column_names)}")
+        summaries = _fetch_summaries(dc.GetSummaryResultsColumn, column_names, _column_summary_out_args())
 
-            result = {"Frame_Name": name}
-            try:
-                res = dc.GetSummaryResultsColumn(name, 0, [], [], [], [], [], [], [], [], [], [], [], [])
-                ret_code, num_items, pmm_areas, *_ = res
-
-                if ret_code == 0 and num_items > 0:
-                    areas = [a for a in convert_system_array_to_python_list(pmm_areas) if a > 0]
-                    max_area = max(areas) if areas else 0
-                    result.update({"Src": "OK", "Long_Rebar_m2": f"{max_area:.6f}"})
-                    valid_results += 1
-                else:
-                    result.update({"Src": "No Results", "Long_Rebar_m2": 0})
+        progress_step = _progress_step(len(column_names))
+        for i, (name, res) in enumerate(zip(column_names, summaries)):
+            if (i + 1) % progress_step == 0:
+                log.info("    Progress: %d/%d", i + 1, len(column_names))
 
-            except Exception as exc:  # noqa: BLE001
-                result.update({"Src": f"Error: {str(exc)[:40]}", "Long_Rebar_m2": 0})
+            if isinstance(res, Exception):
+                sources[i] = f"Error: {str(res)[:40]}"
+                continue
 
-            all_results.append(result)
+            # (ret, NumberItems, FrameName, MyOption, Location, PMMCombo, PMMArea, ...)
+            if res[0] == 0 and res[1] > 0:
+                areas[i] = _positive_max(res[6])
+                ok[i] = True
+                sources[i] = "OK"
+                valid_results += 1
+            else:
+                sources[i] = "No Results"
 
-        filepath = os.path.join(output_dir, "column_design_results_final.csv")
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=all_results[0].keys())
-            writer.writeheader()
-            writer.writerows(all_results)
+        if filepath is None:
+            filepath = os.path.join(output_dir, COLUMN_RESULTS_FILENAME)
+        formatted = np.char.mod("%.6f", areas)
+        formatted[~ok] = "0"  # rows without results keep the plain "0" of the original format
+        _write_csv(filepath, _COLUMN_RESULT_HEADER, zip(column_names, sources, formatted))
 
         print(f"Column results saved to {filepath}")
         print(f"   Completed: {valid_results}/{len(column_names)}")
@@ -697,6 +848,8 @@ def extract_and_save_column_results(output_dir: str) -> None:
 
 __all__ = [
     'convert_system_array_to_python_list',
+    'get_all_frame_names',
+    'get_beam_and_column_names',
     'convert_area_units',
     'convert_shear_area_units',
     'validate_reinforcement_area',
@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import os
 import csv
-import traceback
 from typing import List, Dict, Any
 
 from common.etabs_setup import get_etabs_objects
@@ -70,12 +69,16 @@ def extract_frame_forces(frame_names: List[str], load_cases: List[str]) -> List[
     all_forces_data = []
     processed_count = 0
 
+    # Resolve the bound method, enum member and out-parameter placeholders once;
+    # ETABS returns fresh arrays on every call, so the placeholders can be shared
+    frame_force = results_api.FrameForce
+    object_elm = ETABSv1.eItemTypeElm.ObjectElm
+    params = _prepare_force_output_params()
+
     # 2. 
     for frame_name in frame_names:
         try:
-            params = _prepare_force_output_params()
-
-            force_res = results_api.FrameForce(frame_name, ETABSv1.eItemTypeElm.ObjectElm, *params)
+            force_res = frame_force(frame_name, object_elm, *params)
 
             check_ret(force_res[0], f"FrameForce({frame_name})", (0, 1))
 
@@ -138,10 +141,11 @@ def save_forces_to_csv(force_data: List[Dict[str, Any]], filename: str):
     try:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, "w", newline="", encoding="utf-8-sig") as csvfile:
-            fieldnames = force_data[0].keys()
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(force_data)
+            fieldnames = tuple(force_data[0])
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Positional rows; missing keys become "" as DictWriter's restval did
+            writer.writerows(tuple(d.get(k, "") for k in fieldnames) for d in force_data)
         print("Frame forces CSV written.")
     except Exception as e:
         print(f"Failed to write frame forces CSV: {e}")
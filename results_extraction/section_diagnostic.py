@@ -22,6 +22,7 @@ except:
 
 from common.etabs_setup import get_etabs_objects
 from common.config import FRAME_BEAM_SECTION_NAME, FRAME_COLUMN_SECTION_NAME
+from .design_results import get_beam_and_column_names
 
 
 def test_and_fix_setsection_api():
@@ -39,17 +40,13 @@ def test_and_fix_setsection_api():
         if sap_model.GetModelIsLocked():
             sap_model.SetModelIsLocked(False)
 
-        # 获取一个测试构件
-        NumberNames, FrameNames_tuple = 0, System.Array.CreateInstance(System.String, 0)
-        ret, NumberNames, FrameNames_tuple = sap_model.FrameObj.GetNameList(NumberNames, FrameNames_tuple)
-
-        if ret != 0:
+        # 获取一个测试构件：复用 design_results 中一次 GetNameList 单次遍历分类得到的梁/柱名称列表
+        names = get_beam_and_column_names(sap_model)
+        if names is None:
             print("❌ 无法获取构件列表")
             return False
 
-        frame_names = list(FrameNames_tuple)
-        beam_names = [name for name in frame_names if name.upper().startswith("BEAM")]
-        col_names = [name for name in frame_names if name.upper().startswith("COL")]
+        beam_names, col_names = names
 
         if not beam_names:
             print("❌ 没有找到梁构件")